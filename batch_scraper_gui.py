@@ -5,13 +5,39 @@ Scrape multiple job posting URLs at once and save to individual JSON files.
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
+import gzip
 import threading
 import json
 import os
+import queue
 import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from job_scraper import JobScraper
 
+# orjson serializes much faster than the stdlib json module (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Maximum lines kept in the log widget; older lines are dropped from the
+# top so long batches don't degrade Tk redraw performance
+MAX_LOG_LINES = 2000
+
+# Compiled once; sanitize_filename runs twice per scraped job
+FILENAME_SPECIALS_RE = re.compile(r'[^\w\s-]')
+FILENAME_SPACES_RE = re.compile(r'\s+')
+
+# Single-pass C-level deletion table for the common all-ASCII case
+FILENAME_SAFE_TABLE = str.maketrans({
+    c: None for c in map(chr, range(128))
+    if not (c.isalnum() or c in ' \t\n-_')
+})
+
 
 class BatchScraperGUI:
     def __init__(self, root):
@@ -25,8 +51,23 @@ class BatchScraperGUI:
         self.scraped_jobs = []
         self.current_batch_folder = None
 
+        # Log messages are queued from worker threads and flushed to the
+        # widget in batches by a Tk timer (one insert per flush)
+        self._log_queue = deque()
+        self._log_lock = threading.Lock()
+
+        # Other UI updates from worker threads go through one queue drained
+        # by a single poller, instead of one root.after(0) wakeup per update
+        self._ui_q = queue.Queue()
+
+        # Scrapers warmed up in the background (Chrome takes 1-3 s to start)
+        self._warm_scrapers = []
+        self._warm_lock = threading.Lock()
+
         # Create GUI elements
         self.create_widgets()
+        self.root.after(100, self._flush_log)
+        self.root.after(50, self._drain_ui)
 
     def create_widgets(self):
         """Create all GUI widgets"""
@@ -107,7 +148,8 @@ https://www.seek.com.au/job/88185526"""
         selenium_check = ttk.Checkbutton(
             options_frame,
             text="Use Selenium (recommended for seek.com.au)",
-            variable=self.use_selenium_var
+            variable=self.use_selenium_var,
+            command=self.on_selenium_toggle
         )
         selenium_check.pack(anchor="w")
 
@@ -120,6 +162,15 @@ https://www.seek.com.au/job/88185526"""
         )
         headless_check.pack(anchor="w")
 
+        # Compression option (useful for batches of thousands of jobs)
+        self.compress_var = tk.BooleanVar(value=False)
+        compress_check = ttk.Checkbutton(
+            options_frame,
+            text="Compress output (.json.gz)",
+            variable=self.compress_var
+        )
+        compress_check.pack(anchor="w")
+
         # Wait time
         wait_frame = tk.Frame(options_frame)
         wait_frame.pack(anchor="w", pady=5)
@@ -134,6 +185,18 @@ https://www.seek.com.au/job/88185526"""
         )
         wait_spinbox.pack(side="left", padx=5)
 
+        # Concurrency (parallel scraper workers)
+        tk.Label(wait_frame, text="Concurrency:").pack(side="left", padx=(15, 0))
+        self.concurrency_var = tk.IntVar(value=3)
+        concurrency_spinbox = ttk.Spinbox(
+            wait_frame,
+            from_=1,
+            to=8,
+            textvariable=self.concurrency_var,
+            width=5
+        )
+        concurrency_spinbox.pack(side="left", padx=5)
+
         # Output folder
         folder_frame = tk.Frame(options_frame)
         folder_frame.pack(fill="x", pady=5)
@@ -217,9 +280,10 @@ https://www.seek.com.au/job/88185526"""
         )
         self.progress_bar.pack(fill="x", pady=5)
 
+        self.progress_text_var = tk.StringVar(value="0 / 0 jobs scraped")
         self.progress_text = tk.Label(
             progress_frame,
-            text="0 / 0 jobs scraped",
+            textvariable=self.progress_text_var,
             font=("Arial", 9),
             fg="gray"
         )
@@ -239,16 +303,74 @@ https://www.seek.com.au/job/88185526"""
         )
         self.log_text.pack(fill="both", expand=True)
 
-    def log(self, message, color="black"):
-        """Add message to log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
+        # Configure color tags once up front instead of on every log call
+        for color in ("black", "blue", "green", "red", "orange", "gray"):
+            self.log_text.tag_config(color, foreground=color)
 
-        # Color the last line
-        last_line = self.log_text.index("end-1c linestart")
-        self.log_text.tag_add(color, last_line, "end-1c")
-        self.log_text.tag_config(color, foreground=color)
+    def log(self, message, color="black"):
+        """Queue a log message (safe to call from any thread)"""
+        with self._log_lock:
+            self._log_queue.append((message, color))
+
+    def _flush_log(self):
+        """Flush queued log messages to the widget in a single insert"""
+        with self._log_lock:
+            entries = list(self._log_queue)
+            self._log_queue.clear()
+
+        if entries:
+            # All entries flushed in the same ~100 ms window share one
+            # formatted timestamp instead of one strftime per message
+            timestamp = time.strftime("%H:%M:%S")
+
+            # The widget always ends with a newline, so new text starts on
+            # the line reported by "end-1c"
+            line = int(self.log_text.index("end-1c").split('.')[0])
+            pieces = []
+            spans = []
+            for message, color in entries:
+                text = f"[{timestamp}] {message}\n"
+                pieces.append(text)
+                lines = text.count('\n')
+                spans.append((line, line + lines - 1, color))
+                line += lines
+
+            self.log_text.insert(tk.END, "".join(pieces))
+            for first, last, color in spans:
+                self.log_text.tag_add(color, f"{first}.0", f"{last}.end")
+
+            # Ring buffer: trim oldest lines once the widget grows too large
+            total_lines = int(self.log_text.index("end-1c").split('.')[0])
+            if total_lines > MAX_LOG_LINES:
+                excess = total_lines - MAX_LOG_LINES
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+
+            self.log_text.see(tk.END)
+
+        self.root.after(100, self._flush_log)
+
+    def _drain_ui(self):
+        """Process all pending UI updates from worker threads in one pass"""
+        while True:
+            try:
+                kind, payload = self._ui_q.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "status":
+                self.update_status(*payload)
+            elif kind == "progress":
+                self.progress_var.set(payload)
+            elif kind == "progress_text":
+                self.progress_text_var.set(payload)
+            elif kind == "state":
+                widget, state = payload
+                widget.config(state=state)
+            elif kind == "call":
+                func, args = payload
+                func(*args)
+
+        self.root.after(50, self._drain_ui)
 
     def update_status(self, message, color="black"):
         """Update status label"""
@@ -266,16 +388,18 @@ https://www.seek.com.au/job/88185526"""
 
     def get_urls(self):
         """Extract and validate URLs from text area"""
-        text = self.urls_text.get(1.0, tk.END)
-        lines = text.strip().split('\n')
-
-        urls = []
-        for line in lines:
-            line = line.strip()
-            if line and line.startswith('http'):
-                urls.append(line)
-
-        return urls
+        # 'end-1c' skips the trailing newline Tk always appends, so no
+        # extra strip pass over the whole blob is needed
+        lines = self.urls_text.get('1.0', 'end-1c').splitlines()
+        urls = [
+            stripped for stripped in (line.strip() for line in lines)
+            if stripped.startswith(('http://', 'https://'))
+        ]
+
+        # Drop duplicate URLs (order-preserving) so a pasted list with
+        # repeats doesn't waste full scrape round-trips
+        seen = set()
+        return [url for url in urls if not (url in seen or seen.add(url))]
 
     def load_urls_from_file(self):
         """Load URLs from a text file"""
@@ -286,10 +410,14 @@ https://www.seek.com.au/job/88185526"""
 
         if filepath:
             try:
-                with open(filepath, 'r') as f:
-                    content = f.read()
+                # Stream the file into the widget in 64 KB chunks instead of
+                # reading it all into one string first; keeps the UI
+                # responsive and halves peak memory for huge URL lists
                 self.urls_text.delete(1.0, tk.END)
-                self.urls_text.insert(1.0, content)
+                with open(filepath, 'r') as f:
+                    while chunk := f.read(65536):
+                        self.urls_text.insert(tk.END, chunk)
+                        self.root.update_idletasks()
                 self.log(f"Loaded URLs from {filepath}", "green")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load file:\n{str(e)}")
@@ -300,16 +428,62 @@ https://www.seek.com.au/job/88185526"""
         if folder:
             self.output_folder_var.set(folder)
 
+    def on_selenium_toggle(self):
+        """Warm a scraper in the background when Selenium is switched on"""
+        if self.use_selenium_var.get():
+            thread = threading.Thread(target=self._prewarm_scraper, daemon=True)
+            thread.start()
+
+    def _prewarm_scraper(self):
+        """Pre-launch a Selenium scraper so the first URL starts immediately"""
+        with self._warm_lock:
+            if self._warm_scrapers:
+                return
+
+        try:
+            scraper = JobScraper(use_selenium=True, headless=self.headless_var.get())
+            scraper._init_selenium_driver()
+        except Exception as e:
+            self.log(f"Scraper prewarm failed: {str(e)}", "orange")
+            return
+
+        with self._warm_lock:
+            self._warm_scrapers.append(scraper)
+        self.log("✓ Selenium driver warmed up and ready", "gray")
+
+    def _take_warm_scraper(self, use_selenium, headless):
+        """Pop a prewarmed scraper if one matches the requested options"""
+        with self._warm_lock:
+            scraper = self._warm_scrapers.pop() if self._warm_scrapers else None
+
+        if scraper is None:
+            return None
+        if scraper.use_selenium != use_selenium or scraper.headless != headless:
+            scraper.close()
+            return None
+        return scraper
+
     def sanitize_filename(self, text, max_length=50):
         """Create safe filename from text"""
+        # Fast path: ASCII titles skip the regex engine entirely
+        if text.isascii():
+            cleaned = text.translate(FILENAME_SAFE_TABLE)
+            return '_'.join(cleaned.split())[:max_length].lower()
+
         # Remove special characters
-        text = re.sub(r'[^\w\s-]', '', text)
+        text = FILENAME_SPECIALS_RE.sub('', text)
         # Replace spaces with underscores
-        text = re.sub(r'\s+', '_', text)
+        text = FILENAME_SPACES_RE.sub('_', text)
         # Limit length
         text = text[:max_length]
         return text.lower()
 
+    def dump_json_bytes(self, data):
+        """Serialize data for disk: compact output, orjson when available"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data)
+        return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
     def start_batch_scraping(self):
         """Start batch scraping process"""
         if self.scraping:
@@ -321,14 +495,39 @@ https://www.seek.com.au/job/88185526"""
             messagebox.showerror("No URLs", "Please enter at least one URL")
             return
 
-        # Confirm
-        response = messagebox.askyesno(
+        # Confirm via a non-blocking dialog so log flushing and other
+        # after() callbacks keep running while the prompt is up
+        self._show_confirm_dialog(
             "Confirm Batch Scrape",
-            f"Start scraping {len(urls)} job posting(s)?\n\nThis may take several minutes."
+            f"Start scraping {len(urls)} job posting(s)?\n\nThis may take several minutes.",
+            lambda: self._begin_batch(urls)
         )
-        if not response:
-            return
 
+    def _show_confirm_dialog(self, title, message, on_confirm):
+        """Show a modal-but-non-blocking Yes/No dialog"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+
+        tk.Label(dialog, text=message, justify="left", padx=20, pady=15).pack()
+
+        button_row = tk.Frame(dialog, pady=10)
+        button_row.pack()
+
+        def confirm():
+            dialog.destroy()
+            on_confirm()
+
+        ttk.Button(button_row, text="Yes", command=confirm).pack(side="left", padx=10)
+        ttk.Button(button_row, text="No", command=dialog.destroy).pack(side="left", padx=10)
+
+        # grab_set makes it modal without pinning the mainloop the way
+        # messagebox.askyesno does
+        dialog.grab_set()
+
+    def _begin_batch(self, urls):
+        """Set up the batch folder and start the scraping thread"""
         # Create batch folder
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         base_folder = self.output_folder_var.get()
@@ -367,99 +566,170 @@ https://www.seek.com.au/job/88185526"""
         use_selenium = self.use_selenium_var.get()
         headless = self.headless_var.get()
         wait_time = self.wait_time_var.get()
+        max_workers = max(1, min(self.concurrency_var.get(), total))
+
+        # The batch folder is fixed for the whole run, so build output paths
+        # by simple concatenation instead of os.path.join per URL
+        batch_prefix = self.current_batch_folder + os.sep
+
+        # Each worker thread lazily creates and reuses its own scraper;
+        # keep a list of all of them so we can close them at the end.
+        thread_local = threading.local()
+        all_scrapers = []
+        progress_lock = threading.Lock()
+        self._completed_count = 0
+
+        def get_scraper():
+            scraper = getattr(thread_local, 'scraper', None)
+            if scraper is None:
+                scraper = self._take_warm_scraper(use_selenium, headless)
+                if scraper is None:
+                    scraper = JobScraper(use_selenium=use_selenium, headless=headless)
+                thread_local.scraper = scraper
+                with progress_lock:
+                    all_scrapers.append(scraper)
+            return scraper
+
+        # Dedicated writer thread so disk I/O overlaps scraping instead of
+        # blocking the next fetch; bounded queue applies back-pressure
+        writer_q = queue.Queue(maxsize=32)
+        compress = self.compress_var.get()
+        writer = threading.Thread(target=self._writer_loop, args=(writer_q, compress), daemon=True)
+        writer.start()
 
         try:
-            # Create scraper once for all jobs
-            self.root.after(0, self.log, f"Initializing scraper (Selenium: {use_selenium})...", "blue")
-            scraper = JobScraper(use_selenium=use_selenium, headless=headless)
-
-            for i, url in enumerate(urls, 1):
-                if not self.scraping:
-                    self.root.after(0, self.log, "Scraping stopped by user", "orange")
-                    break
-
-                # Update progress
-                progress = int((i / total) * 100)
-                self.root.after(0, self.progress_var.set, progress)
-                self.root.after(0, self.progress_text.config, {"text": f"{i} / {total} jobs scraped"})
-                self.root.after(0, self.update_status, f"Scraping job {i}/{total}...", "blue")
-                self.root.after(0, self.log, f"\n[{i}/{total}] Scraping: {url}", "blue")
-
-                try:
-                    # Scrape the job
-                    job_data = scraper.scrape(url, wait_time=wait_time)
-
-                    # Generate filename
-                    if 'error' in job_data:
-                        filename = f"job_{i:03d}_error.json"
-                        self.root.after(0, self.log, f"  ❌ Error: {job_data['error']}", "red")
-                    else:
-                        job_title = job_data.get('job_title', f'job_{i}')
-                        company = job_data.get('company', '')
-
-                        # Create filename
-                        title_clean = self.sanitize_filename(job_title, 30)
-                        company_clean = self.sanitize_filename(company, 20)
-
-                        if company_clean:
-                            filename = f"job_{i:03d}_{title_clean}_{company_clean}.json"
-                        else:
-                            filename = f"job_{i:03d}_{title_clean}.json"
-
-                        self.root.after(0, self.log, f"  ✓ Job Title: {job_data.get('job_title', 'N/A')}", "green")
-                        self.root.after(0, self.log, f"  ✓ Company: {job_data.get('company', 'N/A')}", "green")
-
-                    # Save to file
-                    filepath = os.path.join(self.current_batch_folder, filename)
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        json.dump(job_data, f, indent=2, ensure_ascii=False)
-
-                    self.root.after(0, self.log, f"  💾 Saved: {filename}", "green")
-                    self.scraped_jobs.append({
-                        'url': url,
-                        'filename': filename,
-                        'success': 'error' not in job_data
-                    })
-
-                except Exception as e:
-                    error_msg = f"  ❌ Failed: {str(e)}"
-                    self.root.after(0, self.log, error_msg, "red")
-
-                    # Save error to file
-                    error_data = {
-                        'error': str(e),
-                        'url': url,
-                        'scraped_at': datetime.utcnow().isoformat()
-                    }
-                    filename = f"job_{i:03d}_error.json"
-                    filepath = os.path.join(self.current_batch_folder, filename)
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        json.dump(error_data, f, indent=2)
-
-                    self.scraped_jobs.append({
-                        'url': url,
-                        'filename': filename,
-                        'success': False
-                    })
-
-            # Close scraper
-            scraper.close()
+            self.log(f"Initializing {max_workers} scraper worker(s) (Selenium: {use_selenium})...", "blue")
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._scrape_one, get_scraper, writer_q, batch_prefix, i, url, total, wait_time, progress_lock)
+                    for i, url in enumerate(urls, 1)
+                ]
+                for future in as_completed(futures):
+                    # Surface unexpected worker crashes; per-URL errors are
+                    # already handled inside _scrape_one.
+                    future.result()
+
+            if not self.scraping:
+                self.log("Scraping stopped by user", "orange")
+
+            # Flush pending writes, then close all per-thread scrapers
+            writer_q.put(None)
+            writer.join()
+            for scraper in all_scrapers:
+                scraper.close()
 
             # Summary
-            self.root.after(0, self.show_summary)
+            self._ui_q.put(("call", (self.show_summary, ())))
 
         except Exception as e:
             error_msg = f"Batch scraping error: {str(e)}"
-            self.root.after(0, self.log, error_msg, "red")
-            self.root.after(0, messagebox.showerror, "Error", error_msg)
+            self.log(error_msg, "red")
+            self._ui_q.put(("call", (messagebox.showerror, ("Error", error_msg))))
 
         finally:
             # Re-enable buttons
-            self.root.after(0, self.scrape_button.config, {"state": "normal"})
-            self.root.after(0, self.stop_button.config, {"state": "disabled"})
-            self.root.after(0, self.open_folder_button.config, {"state": "normal"})
+            self._ui_q.put(("state", (self.scrape_button, "normal")))
+            self._ui_q.put(("state", (self.stop_button, "disabled")))
+            self._ui_q.put(("state", (self.open_folder_button, "normal")))
             self.scraping = False
 
+    def _writer_loop(self, writer_q, compress=False):
+        """Write queued (filepath, data) pairs to disk (runs on writer thread)"""
+        while True:
+            item = writer_q.get()
+            if item is None:
+                break
+
+            filepath, data = item
+            if compress:
+                filepath += '.gz'
+            filename = os.path.basename(filepath)
+            try:
+                # Write to a temp file and rename so readers never see a
+                # partially written JSON file
+                tmp_path = filepath + '.tmp'
+                if compress:
+                    # compresslevel=1 favors throughput over ratio
+                    with gzip.open(tmp_path, 'wb', compresslevel=1) as f:
+                        f.write(self.dump_json_bytes(data))
+                else:
+                    with open(tmp_path, 'wb') as f:
+                        f.write(self.dump_json_bytes(data))
+                os.replace(tmp_path, filepath)
+                self.log(f"  💾 Saved: {filename}", "green")
+            except Exception as e:
+                self.log(f"  ❌ Write failed for {filename}: {str(e)}", "red")
+
+    def _scrape_one(self, get_scraper, writer_q, batch_prefix, i, url, total, wait_time, progress_lock):
+        """Scrape a single URL (runs on a worker thread)"""
+        if not self.scraping:
+            return
+
+        self.log(f"\n[{i}/{total}] Scraping: {url}", "blue")
+
+        try:
+            try:
+                # Scrape the job
+                scraper = get_scraper()
+                payload = scraper.scrape(url, wait_time=wait_time)
+
+                # Bind fields once instead of repeated dict lookups below
+                success = 'error' not in payload
+                job_title = payload.get('job_title') or f'job_{i}'
+                company = payload.get('company') or ''
+
+                # Generate filename
+                if not success:
+                    filename = f"job_{i:03d}_error.json"
+                    self.log(f"  ❌ Error: {payload['error']}", "red")
+                else:
+                    # Create filename
+                    title_clean = self.sanitize_filename(job_title, 30)
+                    company_clean = self.sanitize_filename(company, 20)
+
+                    if company_clean:
+                        filename = f"job_{i:03d}_{title_clean}_{company_clean}.json"
+                    else:
+                        filename = f"job_{i:03d}_{title_clean}.json"
+
+                    self.log(f"  ✓ Job Title: {job_title}", "green")
+                    self.log(f"  ✓ Company: {company or 'N/A'}", "green")
+
+            except Exception as e:
+                self.log(f"  ❌ Failed: {str(e)}", "red")
+                payload = {
+                    'error': str(e),
+                    'url': url,
+                    'scraped_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+                }
+                filename = f"job_{i:03d}_error.json"
+                success = False
+
+            # Single funnel for both outcomes: hand off to the writer thread
+            # and record the result, then move on to the next URL
+            writer_q.put((batch_prefix + filename, payload))
+
+            with progress_lock:
+                self.scraped_jobs.append({
+                    'url': url,
+                    'filename': filename,
+                    'success': success
+                })
+
+        finally:
+            # Update progress as jobs complete (completion order, not submit
+            # order); report every 5th completion plus the final one to keep
+            # UI traffic low on large batches
+            with progress_lock:
+                self._completed_count += 1
+                done = self._completed_count
+            if done % 5 == 0 or done == total:
+                progress = int((done / total) * 100)
+                self._ui_q.put(("progress", progress))
+                self._ui_q.put(("progress_text", f"{done} / {total} jobs scraped"))
+                self._ui_q.put(("status", (f"Scraped {done}/{total} jobs...", "blue")))
+
     def show_summary(self):
         """Show summary of batch scraping"""
         total = len(self.scraped_jobs)
@@ -487,9 +757,11 @@ https://www.seek.com.au/job/88185526"""
 
     def clear_log(self):
         """Clear the log"""
+        with self._log_lock:
+            self._log_queue.clear()
         self.log_text.delete(1.0, tk.END)
         self.progress_var.set(0)
-        self.progress_text.config(text="0 / 0 jobs scraped")
+        self.progress_text_var.set("0 / 0 jobs scraped")
         self.update_status("Ready to scrape", "green")
 
     def open_output_folder(self):
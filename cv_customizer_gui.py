@@ -8,38 +8,389 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import json
 import os
+import queue
+import re
+import shutil
 import threading
 import subprocess
 import platform
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 import base64
+import hashlib
 
-# Document parsing imports
-try:
-    from pypdf import PdfReader
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
+import llm_cache
 
-try:
-    from docx import Document
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+# Heavy libraries (PDF/DOCX parsers, the API client) are imported lazily
+# inside the functions that use them so the GUI window appears quickly.
+# find_spec only probes the import machinery, it does not execute the module.
+import importlib.util
 
-from bs4 import BeautifulSoup
+# PyMuPDF's C-backed extractor is ~10x faster than pypdf on multi-page
+# PDFs, so prefer it and keep pypdf as a fallback
+PYMUPDF_AVAILABLE = importlib.util.find_spec("pymupdf") is not None
+PYPDF_AVAILABLE = importlib.util.find_spec("pypdf") is not None
+PDF_AVAILABLE = PYMUPDF_AVAILABLE or PYPDF_AVAILABLE
+
+DOCX_AVAILABLE = importlib.util.find_spec("docx") is not None
 
 # Claude API
-try:
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
+
+ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+
+# OS keychain for the API key (falls back to the old base64 config field)
+KEYRING_AVAILABLE = importlib.util.find_spec("keyring") is not None
+KEYRING_SERVICE = "cv_customizer"
+KEYRING_USERNAME = "anthropic"
+
+
+def dump_json_list(items):
+    """Serialize a list for prompt embedding, preferring orjson"""
+    if ORJSON_AVAILABLE:
+        import orjson
+        return orjson.dumps(items, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(items, indent=2)
+
+
+def load_json_file(filepath):
+    """Parse a JSON file, preferring orjson's C parser for big job files"""
+    # Raw fd read: one open/read/close per file with no BufferedReader
+    # layer, which matters when prefetching hundreds of small job files
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    if ORJSON_AVAILABLE:
+        import orjson
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_WS_RUN_RE = re.compile(r'[ \t]+')
+_BLANK_RUN_RE = re.compile(r'\n{3,}')
+
+
+def normalize_profile_text(text):
+    """Shrink profile text before it is embedded in every prompt.
+
+    Collapses whitespace runs and drops exact duplicate paragraphs (e.g.
+    the same summary exported in both the PDF and DOCX CV). Every token
+    removed here is saved on all three calls for every job.
+    """
+    text = _WS_RUN_RE.sub(' ', text)
+    text = _BLANK_RUN_RE.sub('\n\n', text)
+
+    seen = set()
+    paragraphs = []
+    for para in text.split('\n\n'):
+        para = para.strip()
+        if not para:
+            continue
+        # Short lines (headers, bullets) may legitimately repeat
+        if len(para) > 40:
+            if para in seen:
+                continue
+            seen.add(para)
+        paragraphs.append(para)
+    return '\n\n'.join(paragraphs)
+
+
+def dump_json_file(filepath, obj):
+    """Serialize obj to a JSON file, preferring orjson"""
+    if ORJSON_AVAILABLE:
+        import orjson
+        data = orjson.dumps(obj)
+    else:
+        data = json.dumps(obj).encode('utf-8')
+    with open(filepath, 'wb') as f:
+        f.write(data)
+
+
+def write_text_file(filepath, content):
+    """Write text output with one encode and one write syscall.
+
+    Skips the TextIOWrapper layer, which adds up across the 3xN small
+    output files a large batch produces.
+    """
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, content.encode('utf-8'))
+    finally:
+        os.close(fd)
 
 # Template directory
 PROMPTS_DIR = "prompts"
 
+# Context budget (all supported models have a 200k window); prompts are
+# sized against this before sending so no call fails or truncates
+MODEL_CONTEXT_TOKENS = 200000
+PROFILE_TOKEN_BUDGET = 150000
+
+# On-disk cache of parsed profile documents, keyed by (path, mtime, size)
+DOC_CACHE_DIR = ".doc_cache"
+
+# Diagnostic chatter is off unless explicitly requested; stdout writes
+# from many workers are slow and interleave badly
+DEBUG = bool(os.environ.get("CV_CUSTOMIZER_DEBUG"))
+
+
+def dprint(*args):
+    if DEBUG:
+        print(*args)
+
+
+# Document readers live at module level (not methods) so they are picklable
+# and can run on a process pool when several documents load at once.
+
+def read_document(filepath):
+    """Read content from various document formats"""
+    ext = os.path.splitext(filepath)[1].lower()
+
+    try:
+        if ext == '.pdf':
+            return read_pdf(filepath)
+        elif ext == '.docx':
+            return read_docx(filepath)
+        elif ext in ['.html', '.htm']:
+            return read_html(filepath)
+        elif ext == '.txt':
+            return read_txt(filepath)
+        else:
+            return f"[Unsupported file type: {ext}]"
+    except Exception as e:
+        return f"[Error reading file: {str(e)}]"
+
+
+# Parsed text by (path, mtime, size): repeated Generate presses in one
+# session skip even the disk-cache read
+_doc_memory_cache = {}
+
+
+def cached_read_document(filepath):
+    """Read a document through the in-memory and on-disk parse caches.
+
+    Parsing a 30-page PDF costs seconds; reading the cached text back
+    is near-instant. The cache key includes mtime and size, so edited
+    documents are re-parsed automatically.
+    """
+    try:
+        stat = os.stat(filepath)
+        mem_key = (filepath, stat.st_mtime, stat.st_size)
+        key = hashlib.sha1(f"{filepath}:{stat.st_mtime}:{stat.st_size}".encode()).hexdigest()
+    except OSError:
+        return read_document(filepath)
+
+    cached = _doc_memory_cache.get(mem_key)
+    if cached is not None:
+        return cached
+
+    cache_path = os.path.join(DOC_CACHE_DIR, f"{key}.txt")
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        _doc_memory_cache[mem_key] = content
+        return content
+    except OSError:
+        pass
+
+    content = read_document(filepath)
+
+    # Don't cache reader error markers like "[Error reading file: ...]"
+    if not (content.startswith('[') and content.endswith(']')):
+        _doc_memory_cache[mem_key] = content
+        try:
+            os.makedirs(DOC_CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        except OSError:
+            pass
+
+    return content
+
+
+def read_pdf(filepath):
+    """Read PDF file"""
+    if not PDF_AVAILABLE:
+        return "[PDF support not installed. Run: pip install pymupdf]"
+
+    try:
+        if PYMUPDF_AVAILABLE:
+            import pymupdf
+            doc = pymupdf.open(filepath)
+            try:
+                # Tier 1: the text layer, near-free on text-native PDFs
+                text = "\n\n".join(page.get_text("text") for page in doc)
+                if len(text.strip()) >= 50:
+                    return text
+
+                # Tier 2: scanned document with no usable text layer.
+                # OCR costs seconds per page, so only pay it here.
+                try:
+                    dprint(f"DEBUG: No text layer in {os.path.basename(filepath)}, trying OCR")  # DEBUG
+                    return "\n\n".join(
+                        page.get_text("text", textpage=page.get_textpage_ocr())
+                        for page in doc)
+                except Exception:
+                    # Tesseract not installed: return whatever the text layer had
+                    return text
+            finally:
+                doc.close()
+
+        # Fallback: pypdf (pure Python, slower)
+        from pypdf import PdfReader
+        reader = PdfReader(filepath)
+        return "\n\n".join(page.extract_text() for page in reader.pages)
+    except Exception as e:
+        return f"[Error reading PDF: {str(e)}]"
+
+
+def read_docx(filepath):
+    """Read Word document"""
+    if not DOCX_AVAILABLE:
+        return "[DOCX support not installed. Run: pip install python-docx]"
+
+    try:
+        from docx import Document
+        doc = Document(filepath)
+        # Single join keeps this O(n); isspace() skips blanks without
+        # allocating a stripped copy of every paragraph
+        return "\n\n".join(
+            p.text for p in doc.paragraphs if p.text and not p.text.isspace())
+    except Exception as e:
+        return f"[Error reading DOCX: {str(e)}]"
+
+
+def read_html(filepath):
+    """Read HTML file"""
+    try:
+        from lxml import etree
+        from lxml import html as lxml_html
+
+        # Let libxml2 read and decode the file itself — no intermediate
+        # Python string, and it honours the document's declared charset
+        tree = lxml_html.parse(filepath).getroot()
+        # Remove script and style
+        etree.strip_elements(tree, 'script', 'style', with_tail=False)
+        chunks = (chunk.strip() for chunk in tree.itertext())
+        return '\n'.join(chunk for chunk in chunks if chunk)
+    except Exception as e:
+        return f"[Error reading HTML: {str(e)}]"
+
+
+def read_txt(filepath):
+    """Read text file"""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception as e:
+        return f"[Error reading TXT: {str(e)}]"
+
+
+class CompiledTemplate:
+    """A prompt template pre-split on its placeholders.
+
+    fill_template used to run one full str.replace scan per placeholder
+    for every job. Splitting once with a compiled regex and joining the
+    chunks at render time scans each template exactly once per run.
+    """
+
+    PLACEHOLDER_RE = re.compile(
+        r"\{(profile|job_title|company|location|requirements|skills|"
+        r"responsibilities|description|company_research)\}"
+    )
+
+    _cache = {}
+
+    def __init__(self, template):
+        # Alternating [literal, key, literal, key, ..., literal]
+        self._parts = self.PLACEHOLDER_RE.split(template)
+        self._keys = list(dict.fromkeys(self._parts[1::2]))
+        self._render_fn = self._build_renderer()
+
+    @classmethod
+    def compile(cls, template):
+        """Return a cached instance for this template text"""
+        compiled = cls._cache.get(template)
+        if compiled is None:
+            compiled = cls._cache[template] = cls(template)
+        return compiled
+
+    def _build_renderer(self):
+        """Codegen a render function so filling is one f-string evaluation.
+
+        Literal chunks are referenced through _lits rather than embedded
+        in the source, so template content never needs escaping. The
+        generated function looks like:
+
+            def _render(profile, job_title):
+                return f"{_lits[0]}{profile}{_lits[2]}{job_title}{_lits[4]}"
+        """
+        pieces = []
+        for i, part in enumerate(self._parts):
+            pieces.append(f"{{_lits[{i}]}}" if i % 2 == 0 else f"{{{part}}}")
+        src = "def _render({}):\n    return f\"{}\"".format(
+            ", ".join(self._keys), "".join(pieces))
+        namespace = {"_lits": self._parts}
+        exec(src, namespace)
+        return namespace["_render"]
+
+    def render(self, values):
+        """Fill the template in a single compiled string build.
+
+        Placeholders missing from values are left intact so callers can
+        fill them in a later stage (e.g. {profile} in the blocks path).
+        """
+        return self._render_fn(**{
+            k: values[k] if k in values else "{" + k + "}" for k in self._keys})
+
+
+class RateLimiter:
+    """Token-bucket limiter that paces API calls under RPM/TPM caps.
+
+    Pacing requests proactively avoids 429 responses and the seconds of
+    backoff each retry would cost when many jobs run in parallel.
+    """
+
+    def __init__(self, rpm=40, tpm=40000):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last_refill = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._requests = min(float(self.rpm), self._requests + elapsed * (self.rpm / 60.0))
+        self._tokens = min(float(self.tpm), self._tokens + elapsed * (self.tpm / 60.0))
+
+    def acquire(self, estimated_tokens=0):
+        """Block until one request slot and the estimated tokens are free"""
+        # Clamp so a single oversized prompt can never deadlock the bucket
+        needed = min(estimated_tokens, self.tpm)
+        with self._cond:
+            while True:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= needed:
+                    self._requests -= 1
+                    self._tokens -= needed
+                    return
+                self._cond.wait(timeout=0.25)
+
+    def record_usage(self, used_tokens, estimated_tokens=0):
+        """Correct the token bucket with actual usage from a response"""
+        delta = used_tokens - min(estimated_tokens, self.tpm)
+        if delta > 0:
+            with self._cond:
+                self._tokens = max(0.0, self._tokens - delta)
+
 
 class CVCustomizerGUI:
     def __init__(self, root):
@@ -52,6 +403,7 @@ class CVCustomizerGUI:
         self.loaded_documents = []
         self.job_files = []
         self.processing = False
+        self._stop_event = threading.Event()
         self.api_key = ""
         self.config_file = "cv_customizer_config.json"
 
@@ -67,11 +419,16 @@ class CVCustomizerGUI:
             "Casual (Startup/Tech)": "cover_letter_casual.txt"
         }
 
+        # Log lines are queued from any thread and flushed in batches on
+        # a Tk timer, so workers never touch the Text widget directly
+        self._log_queue = queue.Queue()
+
         # Create GUI
         self.create_widgets()
         self.check_dependencies()
         self.check_templates()
         self.load_config()  # Load saved settings
+        self.root.after(100, self._drain_log)
 
     def check_dependencies(self):
         """Check if required libraries are installed"""
@@ -79,7 +436,7 @@ class CVCustomizerGUI:
         if not ANTHROPIC_AVAILABLE:
             missing.append("anthropic")
         if not PDF_AVAILABLE:
-            missing.append("pypdf")
+            missing.append("pymupdf")
         if not DOCX_AVAILABLE:
             missing.append("python-docx")
 
@@ -400,6 +757,22 @@ class CVCustomizerGUI:
             variable=self.research_company_var
         ).pack(side="left", padx=5)
 
+        # Batch mode: one Message Batches API job instead of N live calls
+        self.batch_mode_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            gen_frame,
+            text="📦 Batch mode (~50% cost, results may take a while)",
+            variable=self.batch_mode_var
+        ).pack(side="left", padx=5)
+
+        # Local response cache: re-runs on the same jobs skip the API
+        self.use_cache_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(
+            gen_frame,
+            text="💾 Cache responses locally",
+            variable=self.use_cache_var
+        ).pack(side="left", padx=5)
+
         # Model selection
         model_frame = tk.Frame(options_frame)
         model_frame.pack(fill="x", pady=5)
@@ -426,6 +799,43 @@ class CVCustomizerGUI:
             width=45
         ).pack(side="left", padx=5)
 
+        # Parallel API calls (size to your Anthropic rate-limit tier)
+        tk.Label(model_frame, text="Max concurrency:").pack(side="left", padx=(15, 0))
+        self.concurrency_var = tk.IntVar(value=4)
+        ttk.Spinbox(
+            model_frame,
+            from_=1,
+            to=8,
+            textvariable=self.concurrency_var,
+            width=5
+        ).pack(side="left", padx=5)
+
+        # Rate limits (match your Anthropic tier to avoid 429 backoff)
+        limits_frame = tk.Frame(options_frame)
+        limits_frame.pack(fill="x", pady=5)
+
+        tk.Label(limits_frame, text="Rate limits:").pack(side="left", padx=5)
+        tk.Label(limits_frame, text="Requests/min:").pack(side="left", padx=(10, 0))
+        self.rpm_var = tk.IntVar(value=40)
+        ttk.Spinbox(
+            limits_frame,
+            from_=1,
+            to=1000,
+            textvariable=self.rpm_var,
+            width=6
+        ).pack(side="left", padx=5)
+
+        tk.Label(limits_frame, text="Tokens/min:").pack(side="left", padx=(10, 0))
+        self.tpm_var = tk.IntVar(value=40000)
+        ttk.Spinbox(
+            limits_frame,
+            from_=1000,
+            to=1000000,
+            increment=1000,
+            textvariable=self.tpm_var,
+            width=9
+        ).pack(side="left", padx=5)
+
         # Output folder
         output_frame = tk.Frame(options_frame)
         output_frame.pack(fill="x", pady=5)
@@ -522,14 +932,40 @@ class CVCustomizerGUI:
         self.log_text.pack(fill="both", expand=True)
 
     def log(self, message, color="black"):
-        """Add message to log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
+        """Queue a message for the log (safe from any thread)"""
+        self._log_queue.put((message, color))
 
-        last_line = self.log_text.index("end-1c linestart")
-        self.log_text.tag_add(color, last_line, "end-1c")
-        self.log_text.tag_config(color, foreground=color)
+    def _drain_log(self):
+        """Flush queued log lines into the Text widget in one batch"""
+        entries = []
+        try:
+            while len(entries) < 200:
+                entries.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if entries:
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            start = self.log_text.index("end-1c")
+            self.log_text.insert(
+                tk.END, "".join(f"[{timestamp}] {msg}\n" for msg, _ in entries))
+
+            # Tag each line's span after the single insert
+            line = int(start.split('.')[0])
+            for msg, color in entries:
+                self.log_text.tag_add(color, f"{line}.0", f"{line}.end")
+                self.log_text.tag_config(color, foreground=color)
+                line += 1 + msg.count('\n')
+
+            # Ring buffer: Tk's Text slows down past tens of thousands of
+            # lines, so drop the oldest chunk once we pass the cap
+            total = int(self.log_text.index('end-1c').split('.')[0])
+            if total > 5000:
+                self.log_text.delete('1.0', f'{total - 4000}.0')
+
+            self.log_text.see(tk.END)
+
+        self.root.after(100, self._drain_log)
 
     def update_status(self, message, color="black"):
         """Update status label"""
@@ -551,9 +987,14 @@ class CVCustomizerGUI:
             if self.save_key_var.get():
                 api_key = self.api_key_var.get().strip()
                 if api_key:
-                    # Simple encoding (not encryption, just obfuscation)
-                    encoded_key = base64.b64encode(api_key.encode()).decode()
-                    config['api_key'] = encoded_key
+                    if KEYRING_AVAILABLE:
+                        # OS keychain: actually secret, and <1ms to read back
+                        import keyring
+                        keyring.set_password(KEYRING_SERVICE, KEYRING_USERNAME, api_key)
+                    else:
+                        # Simple encoding (not encryption, just obfuscation)
+                        encoded_key = base64.b64encode(api_key.encode()).decode()
+                        config['api_key'] = encoded_key
 
             # Save other settings
             config['output_folder'] = self.output_folder_var.get()
@@ -562,8 +1003,7 @@ class CVCustomizerGUI:
             config['gen_cover'] = self.gen_cover_var.get()
             config['gen_talking'] = self.gen_talking_var.get()
 
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f)
+            dump_json_file(self.config_file, config)
 
         except Exception as e:
             print(f"Warning: Could not save config: {e}")
@@ -571,12 +1011,22 @@ class CVCustomizerGUI:
     def load_config(self):
         """Load API key and settings from config file"""
         try:
+            if KEYRING_AVAILABLE:
+                try:
+                    import keyring
+                    stored_key = keyring.get_password(KEYRING_SERVICE, KEYRING_USERNAME)
+                    if stored_key:
+                        self.api_key_var.set(stored_key)
+                        self.log("✓ API key loaded from system keychain", "green")
+                except Exception:
+                    pass
+
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
+                config = load_json_file(self.config_file)
 
-                # Load API key
-                if 'api_key' in config:
+                # Legacy base64 field, kept readable for configs saved
+                # before keychain storage (or when keyring is missing)
+                if 'api_key' in config and not self.api_key_var.get():
                     try:
                         decoded_key = base64.b64decode(config['api_key'].encode()).decode()
                         self.api_key_var.set(decoded_key)
@@ -655,11 +1105,150 @@ class CVCustomizerGUI:
             self.log(f"Error loading template {template_file}: {str(e)}", "red")
             return None
 
+    def _get_client(self, api_key):
+        """Return a shared Anthropic client for this key.
+
+        The SDK pools HTTPS connections, so reusing one client across the
+        key test and every generation run amortizes the TLS handshake.
+        """
+        cached = getattr(self, '_anthropic_client', None)
+        if cached is not None and self._anthropic_client_key == api_key:
+            return cached
+
+        from anthropic import Anthropic
+        # Generous timeout so long CV generations reuse the pooled
+        # connection instead of timing out and re-handshaking
+        self._anthropic_client = Anthropic(api_key=api_key, max_retries=2, timeout=120)
+        self._anthropic_client_key = api_key
+        return self._anthropic_client
+
+    def _create_message(self, client, model, max_tokens, prompt, system=None, stream=False):
+        """Call client.messages.create paced by the rate limiter.
+
+        prompt is the user message (string or content blocks); system, if
+        given, is a list of system blocks (e.g. the cacheable profile
+        prefix from fill_template_prompt).
+
+        When the local response cache is enabled, identical calls are
+        served from disk without touching the API; identical calls that
+        are already in flight on another worker are coalesced — the
+        duplicates wait for the first call and read its cached result
+        instead of issuing their own request.
+        """
+        cache = key = None
+        if self.use_cache_var.get():
+            cache = getattr(self, '_llm_cache', None)
+            if cache is None:
+                cache = self._llm_cache = llm_cache.LLMCache()
+                self._inflight_guard = threading.Lock()
+                self._inflight_locks = {}
+            key = llm_cache.make_key(model, prompt, max_tokens, system)
+            cached = cache.get(key)
+            if cached is not None:
+                return SimpleNamespace(content=[SimpleNamespace(text=cached)], usage=None)
+
+            with self._inflight_guard:
+                key_lock = self._inflight_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                # Re-check: another worker may have just populated it
+                cached = cache.get(key)
+                if cached is not None:
+                    return SimpleNamespace(content=[SimpleNamespace(text=cached)], usage=None)
+                return self._send_message(client, model, max_tokens, prompt, system, stream, cache, key)
+
+        return self._send_message(client, model, max_tokens, prompt, system, stream, cache, key)
+
+    def _send_message(self, client, model, max_tokens, prompt, system, stream, cache, key):
+        """Issue the API call (rate-limited), then populate the cache"""
+        if isinstance(prompt, str):
+            prompt_chars = len(prompt)
+        else:
+            prompt_chars = sum(len(block["text"]) for block in prompt)
+        if system:
+            prompt_chars += sum(len(block["text"]) for block in system)
+        # Shrink max_tokens when a huge prompt would overflow the window,
+        # instead of letting the API reject the request
+        estimated_input = prompt_chars // 4
+        if estimated_input + max_tokens > MODEL_CONTEXT_TOKENS:
+            max_tokens = max(256, MODEL_CONTEXT_TOKENS - estimated_input)
+
+        estimated_tokens = estimated_input + max_tokens
+        limiter = getattr(self, 'rate_limiter', None)
+        if limiter:
+            limiter.acquire(estimated_tokens)
+
+        kwargs = {}
+        if system:
+            kwargs['system'] = system
+
+        if stream:
+            # Stream the response so text accumulates as the server
+            # generates it instead of idling until the final payload
+            with client.messages.stream(
+                model=model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}],
+                **kwargs
+            ) as response_stream:
+                chunks = list(response_stream.text_stream)
+                usage = response_stream.get_final_message().usage
+            response = SimpleNamespace(
+                content=[SimpleNamespace(text="".join(chunks))], usage=usage)
+        else:
+            response = client.messages.create(
+                model=model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}],
+                **kwargs
+            )
+
+        usage = getattr(response, 'usage', None)
+        if limiter and usage:
+            limiter.record_usage(usage.input_tokens + usage.output_tokens, estimated_tokens)
+
+        if cache is not None:
+            try:
+                cache.set(key, response.content[0].text)
+            except Exception as cache_error:
+                dprint(f"DEBUG: Response cache write failed: {cache_error}")  # DEBUG
+
+        return response
+
+    COMPANY_CACHE_FILE = ".company_cache.json"
+
+    def _load_company_cache(self):
+        """Load the persisted company research cache (once)"""
+        cache = getattr(self, '_company_cache', None)
+        if cache is None:
+            cache = {}
+            try:
+                cache = load_json_file(self.COMPANY_CACHE_FILE)
+            except (OSError, ValueError):
+                pass
+            self._company_cache = cache
+        return cache
+
+    def _save_company_cache(self):
+        try:
+            dump_json_file(self.COMPANY_CACHE_FILE, self._company_cache)
+        except OSError:
+            pass
+
     def research_company(self, company_name, client, model):
-        """Research company to find values, philosophy, and culture"""
+        """Research company to find values, philosophy, and culture.
+
+        Batches often contain several postings from the same company, so
+        results (including "nothing found") are memoized per company and
+        model, and persisted across restarts.
+        """
         if not company_name or company_name == 'Unknown Company':
             return None
 
+        cache = self._load_company_cache()
+        cache_key = f"{model}:{company_name.strip().lower()}"
+        if cache_key in cache:
+            return cache[cache_key]
+
         try:
             # Use Claude to research the company via web search or knowledge
             research_prompt = f"""Please provide a brief overview of {company_name}, focusing on:
@@ -671,22 +1260,21 @@ class CVCustomizerGUI:
 Keep it concise (3-4 sentences total). If you don't have specific information, say "No specific information available."
 """
 
-            response = client.messages.create(
-                model=model,
-                max_tokens=500,
-                messages=[{"role": "user", "content": research_prompt}]
-            )
+            response = self._create_message(client, model, 500, research_prompt)
 
             company_info = response.content[0].text
 
             # Check if we got useful information
             if "no specific information" in company_info.lower() or "don't have" in company_info.lower():
-                return None
+                company_info = None
 
+            cache[cache_key] = company_info
+            self._save_company_cache()
             return company_info
 
         except Exception as e:
-            print(f"DEBUG: Company research error: {e}")
+            # Errors are not cached so a transient failure retries next job
+            dprint(f"DEBUG: Company research error: {e}")
             return None
 
     def fill_template(self, template, profile, job_data, company_info=None):
@@ -694,24 +1282,66 @@ Keep it concise (3-4 sentences total). If you don't have specific information, s
         if template is None:
             return None
 
-        # Replace placeholders
-        filled = template.replace("{profile}", profile)
-        filled = filled.replace("{job_title}", job_data.get('job_title', 'Unknown Position'))
-        filled = filled.replace("{company}", job_data.get('company', 'Unknown Company'))
-        filled = filled.replace("{location}", job_data.get('location', 'N/A'))
-        filled = filled.replace("{requirements}", json.dumps(job_data.get('requirements', []), indent=2))
-        filled = filled.replace("{skills}", json.dumps(job_data.get('skills', []), indent=2))
-        filled = filled.replace("{responsibilities}", json.dumps(job_data.get('responsibilities', []), indent=2))
-        filled = filled.replace("{description}", job_data.get('description', 'N/A'))
-
-        # Add company research if available
+        return CompiledTemplate.compile(template).render(
+            self._job_field_values(job_data, company_info, profile=profile))
+
+    def fill_template_prompt(self, template, profile, job_data, company_info=None):
+        """Split a filled template into (system blocks, user text).
+
+        The template text up to and including {profile} is identical for
+        every job, so it goes into the system prompt marked with
+        cache_control — after the first call the API serves that prefix
+        from its KV cache instead of re-billing the tokens per job.
+        """
+        if template is None:
+            return None
+
+        head, sep, tail = template.partition("{profile}")
+        if not sep:
+            # No profile placeholder: nothing stable to cache
+            return None, self._fill_job_fields(template, job_data, company_info)
+
+        system = [{
+            "type": "text",
+            "text": self._fill_job_fields(head, job_data, company_info) + profile,
+            "cache_control": {"type": "ephemeral"},
+        }]
+        return system, self._fill_job_fields(tail, job_data, company_info)
+
+    def _fill_job_fields(self, filled, job_data, company_info=None):
+        """Replace the job-specific placeholders in template text"""
+        return CompiledTemplate.compile(filled).render(
+            self._job_field_values(job_data, company_info))
+
+    def _job_field_values(self, job_data, company_info=None, profile=None):
+        """Build the placeholder -> value map for one job"""
         if company_info:
             company_section = f"\n\nCOMPANY RESEARCH:\n{company_info}\n\nUse this information to demonstrate knowledge of the company's values and culture in your response."
-            filled = filled.replace("{company_research}", company_section)
         else:
-            filled = filled.replace("{company_research}", "")
-
-        return filled
+            company_section = ""
+
+        # One job is filled into several templates (CV, cover letter,
+        # talking points), so serialize its lists once and reuse the dumps
+        dumped = job_data.get('_json')
+        if dumped is None:
+            dumped = job_data['_json'] = {
+                k: dump_json_list(job_data.get(k, []))
+                for k in ('requirements', 'skills', 'responsibilities')
+            }
+
+        values = {
+            'job_title': job_data.get('job_title', 'Unknown Position'),
+            'company': job_data.get('company', 'Unknown Company'),
+            'location': job_data.get('location', 'N/A'),
+            'requirements': dumped['requirements'],
+            'skills': dumped['skills'],
+            'responsibilities': dumped['responsibilities'],
+            'description': job_data.get('description', 'N/A'),
+            'company_research': company_section,
+        }
+        if profile is not None:
+            values['profile'] = profile
+        return values
 
     def add_documents(self):
         """Add profile documents"""
@@ -766,12 +1396,17 @@ Keep it concise (3-4 sentences total). If you don't have specific information, s
         self.job_files.clear()
 
         try:
-            json_files = [f for f in os.listdir(folder) if f.endswith('.json')]
-
-            for filename in sorted(json_files):
-                filepath = os.path.join(folder, filename)
-                self.job_files.append(filepath)
-                self.job_listbox.insert(tk.END, filename)
+            # scandir's DirEntry knows the file type from the directory
+            # read itself, so no extra stat() per entry
+            with os.scandir(folder) as it:
+                json_files = sorted(
+                    e.name for e in it if e.is_file() and e.name.endswith('.json'))
+
+            self.job_files.extend(os.path.join(folder, f) for f in json_files)
+            # One Tcl round-trip for the whole folder; per-item insert
+            # triggers a redraw per file on thousand-job batches
+            if json_files:
+                self.job_listbox.insert(tk.END, *json_files)
 
             count = len(json_files)
             self.job_count_label.config(text=f"{count} job(s) loaded", fg="green")
@@ -800,7 +1435,7 @@ Keep it concise (3-4 sentences total). If you don't have specific information, s
 
         try:
             self.log("Testing API key...", "blue")
-            client = Anthropic(api_key=api_key)
+            client = self._get_client(api_key)
 
             # Simple test message
             message = client.messages.create(
@@ -816,74 +1451,6 @@ Keep it concise (3-4 sentences total). If you don't have specific information, s
             self.log(f"✗ API key test failed: {str(e)}", "red")
             messagebox.showerror("API Key Error", f"Failed to validate API key:\n\n{str(e)}")
 
-    def read_document(self, filepath):
-        """Read content from various document formats"""
-        ext = os.path.splitext(filepath)[1].lower()
-
-        try:
-            if ext == '.pdf':
-                return self.read_pdf(filepath)
-            elif ext == '.docx':
-                return self.read_docx(filepath)
-            elif ext in ['.html', '.htm']:
-                return self.read_html(filepath)
-            elif ext == '.txt':
-                return self.read_txt(filepath)
-            else:
-                return f"[Unsupported file type: {ext}]"
-        except Exception as e:
-            return f"[Error reading file: {str(e)}]"
-
-    def read_pdf(self, filepath):
-        """Read PDF file"""
-        if not PDF_AVAILABLE:
-            return "[PDF support not installed. Run: pip install pypdf]"
-
-        try:
-            reader = PdfReader(filepath)
-            text = []
-            for page in reader.pages:
-                text.append(page.extract_text())
-            return "\n\n".join(text)
-        except Exception as e:
-            return f"[Error reading PDF: {str(e)}]"
-
-    def read_docx(self, filepath):
-        """Read Word document"""
-        if not DOCX_AVAILABLE:
-            return "[DOCX support not installed. Run: pip install python-docx]"
-
-        try:
-            doc = Document(filepath)
-            text = []
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    text.append(para.text)
-            return "\n\n".join(text)
-        except Exception as e:
-            return f"[Error reading DOCX: {str(e)}]"
-
-    def read_html(self, filepath):
-        """Read HTML file"""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                html = f.read()
-            soup = BeautifulSoup(html, 'lxml')
-            # Remove script and style
-            for script in soup(['script', 'style']):
-                script.decompose()
-            return soup.get_text(separator='\n', strip=True)
-        except Exception as e:
-            return f"[Error reading HTML: {str(e)}]"
-
-    def read_txt(self, filepath):
-        """Read text file"""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return f.read()
-        except Exception as e:
-            return f"[Error reading TXT: {str(e)}]"
-
     def start_generation(self):
         """Start CV generation process"""
         # Validation
@@ -936,6 +1503,7 @@ Keep it concise (3-4 sentences total). If you don't have specific information, s
 
         # Update UI
         self.processing = True
+        self._stop_event = threading.Event()
         self.generate_button.config(state="disabled")
         self.stop_button.config(state="normal")
         self.log_text.delete(1.0, tk.END)
@@ -954,13 +1522,15 @@ Keep it concise (3-4 sentences total). If you don't have specific information, s
     def stop_generation(self):
         """Stop generation"""
         self.processing = False
+        if getattr(self, '_stop_event', None) is not None:
+            self._stop_event.set()
         self.log("Stop requested by user...", "orange")
 
     def generate_cvs(self, api_key):
         """Generate customized CVs (runs in thread)"""
         try:
             # Initialize Claude client
-            print("DEBUG: Starting generate_cvs thread")  # DEBUG
+            dprint("DEBUG: Starting generate_cvs thread")  # DEBUG
             self.root.after(0, self.log, "Initializing Claude API client...", "blue")
             
             # Extract model name from dropdown selection (format: "Display Name (model-name)")
@@ -972,33 +1542,81 @@ Keep it concise (3-4 sentences total). If you don't have specific information, s
             
             self.root.after(0, self.log, f"Using model: {model}", "gray")
             
+            # Pace calls proactively to the configured limits
+            self.rate_limiter = RateLimiter(self.rpm_var.get(), self.tpm_var.get())
+
             try:
-                client = Anthropic(api_key=api_key)
-                print(f"DEBUG: API client created, model={model}")  # DEBUG
+                client = self._get_client(api_key)
+                dprint(f"DEBUG: API client created, model={model}")  # DEBUG
                 self.root.after(0, self.log, "✓ API client initialized", "green")
             except Exception as api_init_error:
-                print(f"DEBUG: API init failed: {api_init_error}")  # DEBUG
+                dprint(f"DEBUG: API init failed: {api_init_error}")  # DEBUG
                 self.root.after(0, self.log, f"✗ Failed to initialize API: {str(api_init_error)}", "red")
                 raise
 
             # Step 1: Read all profile documents
-            print(f"DEBUG: Loading {len(self.loaded_documents)} profile documents")  # DEBUG
+            dprint(f"DEBUG: Loading {len(self.loaded_documents)} profile documents")  # DEBUG
             self.root.after(0, self.log, "\nStep 1: Reading your profile documents...", "blue")
 
+            # Parse all documents in parallel: PDF/DOCX parsing is CPU-bound,
+            # so a process pool sidesteps the GIL and scales with cores
+            documents = list(self.loaded_documents)
+            workers = min(len(documents), os.cpu_count() or 1)
+            self.root.after(0, self.log, f"  Parsing {len(documents)} document(s) on {workers} worker(s)...", "gray")
+
+            # Spawning processes costs more than parsing small files;
+            # only pay for the pool when a document is big enough (256 KB)
+            try:
+                heavy_parse = any(os.path.getsize(p) > 262144 for p in documents)
+            except OSError:
+                heavy_parse = True
+
+            contents = None
+            if heavy_parse:
+                try:
+                    with ProcessPoolExecutor(max_workers=workers) as executor:
+                        contents = list(executor.map(cached_read_document, documents))
+                except Exception as pool_error:
+                    # e.g. frozen builds without fork support
+                    dprint(f"DEBUG: Process pool failed ({pool_error}), using threads")  # DEBUG
+            if contents is None:
+                # Threads still overlap disk I/O, and lxml releases the
+                # GIL while parsing
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    contents = list(executor.map(cached_read_document, documents))
+
             profile_content = []
-            for i, filepath in enumerate(self.loaded_documents, 1):
+            for filepath, content in zip(documents, contents):
                 filename = os.path.basename(filepath)
-                print(f"DEBUG: Reading document {i}: {filename}")  # DEBUG
-                self.root.after(0, self.log, f"  Reading {i}/{len(self.loaded_documents)}: {filename}", "gray")
-
-                content = self.read_document(filepath)
-                print(f"DEBUG: Document content length: {len(content)}")  # DEBUG
+                dprint(f"DEBUG: Document content length: {len(content)}")  # DEBUG
                 profile_content.append(f"=== Document: {filename} ===\n{content}")
 
-            combined_profile = "\n\n".join(profile_content)
-            print(f"DEBUG: Combined profile length: {len(combined_profile)}")  # DEBUG
+            raw_profile = "\n\n".join(profile_content)
+            combined_profile = normalize_profile_text(raw_profile)
+            if len(combined_profile) < len(raw_profile):
+                saved_chars = len(raw_profile) - len(combined_profile)
+                self.root.after(0, self.log,
+                                f"  Normalized profile: {saved_chars} characters of whitespace/duplicates removed", "gray")
+            dprint(f"DEBUG: Combined profile length: {len(combined_profile)}")  # DEBUG
             self.root.after(0, self.log, f"✓ Loaded {len(self.loaded_documents)} document(s)", "green")
 
+            # Budget the profile against the context window up front: one
+            # accurate count here beats an oversized-request error per job
+            try:
+                profile_tokens = client.messages.count_tokens(
+                    model=model,
+                    messages=[{"role": "user", "content": combined_profile}],
+                ).input_tokens
+            except Exception:
+                profile_tokens = len(combined_profile) // 4
+            while profile_tokens > PROFILE_TOKEN_BUDGET and len(profile_content) > 1:
+                dropped = profile_content.pop()
+                dropped_name = dropped.split('===', 2)[1].strip() if '===' in dropped else 'document'
+                self.root.after(0, self.log,
+                                f"  ⚠ Profile too large ({profile_tokens} tokens), dropping {dropped_name}", "orange")
+                combined_profile = normalize_profile_text("\n\n".join(profile_content))
+                profile_tokens = len(combined_profile) // 4
+
             # Step 2: Load templates
             self.root.after(0, self.log, "\nStep 2: Loading templates...", "blue")
 
@@ -1016,91 +1634,74 @@ Keep it concise (3-4 sentences total). If you don't have specific information, s
             if talking_template:
                 self.root.after(0, self.log, f"  ✓ Loaded talking points template", "green")
 
-            # Step 3: Process each job
+            # Warm the compiled-template cache (regex split + codegen)
+            # here rather than on the first worker's first render
+            for template in (cv_template, cover_template, talking_template):
+                if template:
+                    CompiledTemplate.compile(template)
+                    for fragment in template.partition("{profile}")[::2]:
+                        CompiledTemplate.compile(fragment)
+
+            # Step 3: Process jobs in parallel (each call is network-bound)
             total_jobs = len(self.job_files)
-            print(f"DEBUG: Processing {total_jobs} job files")  # DEBUG
+            max_workers = max(1, min(self.concurrency_var.get(), total_jobs))
+            dprint(f"DEBUG: Processing {total_jobs} job files with {max_workers} worker(s)")  # DEBUG
             self.root.after(0, self.log, f"\nStep 3: Generating customized content for {total_jobs} job(s)...", "blue")
 
-            for i, job_filepath in enumerate(self.job_files, 1):
-                if not self.processing:
-                    break
+            self._generated_count = 0
+            progress_lock = threading.Lock()
+            templates = (cv_template, cover_template, talking_template)
 
-                # Update progress
-                progress = int((i / total_jobs) * 100)
-                self.root.after(0, self.progress_var.set, progress)
-                self.root.after(0, self.progress_text.config, {"text": f"{i} / {total_jobs} CVs generated"})
-
-                job_filename = os.path.basename(job_filepath)
-                print(f"DEBUG: [{i}/{total_jobs}] Processing job: {job_filename}")  # DEBUG
-                self.root.after(0, self.log, f"\n[{i}/{total_jobs}] Processing: {job_filename}", "blue")
+            # Batch mode: submit everything as one Message Batches job
+            # (~50% cost); for small runs per-request latency wins
+            if self.batch_mode_var.get() and total_jobs >= 5:
+                self._generate_via_batch(client, model, combined_profile, templates, total_jobs)
+                self.root.after(0, self.show_completion_summary)
+                return
 
+            # Prefetch every job JSON in one parallel pass so workers start
+            # with parsed dicts instead of each paying open+decode mid-run
+            def load_job(path):
                 try:
-                    # Load job JSON
-                    with open(job_filepath, 'r', encoding='utf-8') as f:
-                        job_data = json.load(f)
-
-                    if 'error' in job_data:
-                        self.root.after(0, self.log, f"  ⚠ Skipping (error in job data)", "orange")
-                        continue
-
-                    # Research company if enabled
-                    company_info = None
-                    if self.research_company_var.get():
-                        company_name = job_data.get('company', 'Unknown Company')
-                        if company_name and company_name != 'Unknown Company':
-                            self.root.after(0, self.log, f"  🔍 Researching {company_name}...", "blue")
-                            try:
-                                company_info = self.research_company(company_name, client, model)
-                                if company_info:
-                                    self.root.after(0, self.log, f"  ✓ Company research completed", "green")
-                                else:
-                                    self.root.after(0, self.log, f"  ℹ No specific company info found", "gray")
-                            except Exception as research_error:
-                                self.root.after(0, self.log, f"  ⚠ Company research failed: {str(research_error)}", "orange")
-
-                    # Generate content
-                    self.root.after(0, self.log, f"  Analyzing job and generating content...", "gray")
-
-                    try:
-                        outputs = self.generate_for_job(
-                            client, model, combined_profile, job_data,
-                            cv_template, cover_template, talking_template, company_info
-                        )
-                        print(f"DEBUG: Generated {len(outputs)} outputs")  # DEBUG
-                    except Exception as api_error:
-                        print(f"DEBUG: API error: {api_error}")  # DEBUG
-                        self.root.after(0, self.log, f"  ✗ API Error: {str(api_error)}", "red")
-                        import traceback
-                        print(traceback.format_exc())  # DEBUG
-                        self.root.after(0, self.log, f"  Details: {traceback.format_exc()}", "red")
-                        continue
-
-                    # Save outputs
-                    base_name = os.path.splitext(job_filename)[0]
-
-                    if not outputs:
-                        self.root.after(0, self.log, f"  ⚠ No content generated", "orange")
-                        continue
-
-                    for content_type, content in outputs.items():
-                        if content:
-                            output_filename = f"{base_name}_{content_type}.txt"
-                            output_path = os.path.join(self.current_output_folder, output_filename)
-
-                            print(f"DEBUG: Saving {content_type} to {output_path}")  # DEBUG
-                            try:
-                                with open(output_path, 'w', encoding='utf-8') as f:
-                                    f.write(content)
-                                print(f"DEBUG: File saved successfully, size: {len(content)} chars")  # DEBUG
-                                self.root.after(0, self.log, f"  ✓ Saved: {output_filename}", "green")
-                            except Exception as save_error:
-                                print(f"DEBUG: Save error: {save_error}")  # DEBUG
-                                self.root.after(0, self.log, f"  ✗ Save Error: {str(save_error)}", "red")
-
-                except Exception as e:
-                    self.root.after(0, self.log, f"  ✗ Error processing job: {str(e)}", "red")
-                    import traceback
-                    self.root.after(0, self.log, f"  Full traceback: {traceback.format_exc()}", "red")
+                    return load_json_file(path)
+                except Exception as load_error:
+                    return {'_load_error': str(load_error)}
+
+            with ThreadPoolExecutor(max_workers=min(8, total_jobs)) as executor:
+                jobs_data = list(executor.map(load_job, self.job_files))
+
+            # Scraped boards repost listings: generate once per distinct
+            # (title, company, description) and copy outputs to duplicates
+            seen_content = {}
+            duplicates = []  # (duplicate index, representative index)
+            unique_indices = []
+            for idx, job_data in enumerate(jobs_data):
+                content_key = self._job_content_key(job_data)
+                if content_key is not None and content_key in seen_content:
+                    duplicates.append((idx, seen_content[content_key]))
+                    continue
+                if content_key is not None:
+                    seen_content[content_key] = idx
+                unique_indices.append(idx)
+
+            if duplicates:
+                self.root.after(0, self.log,
+                                f"ℹ {len(duplicates)} duplicate listing(s) will reuse generated content", "gray")
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._generate_one, client, model, combined_profile,
+                        self.job_files[idx], jobs_data[idx], i, templates, total_jobs, progress_lock
+                    )
+                    for i, idx in enumerate(unique_indices, 1)
+                ]
+                for future in as_completed(futures):
+                    # Per-job errors are handled inside _generate_one
+                    future.result()
+
+            for dup_idx, rep_idx in duplicates:
+                self._copy_job_outputs(rep_idx, dup_idx, total_jobs, progress_lock)
 
             # Done
             self.root.after(0, self.show_completion_summary)
@@ -1116,42 +1717,257 @@ Keep it concise (3-4 sentences total). If you don't have specific information, s
             self.root.after(0, self.open_output_button.config, {"state": "normal"})
             self.processing = False
 
-    def generate_for_job(self, client, model, profile, job_data, cv_template, cover_template, talking_template, company_info=None):
-        """Generate customized content for one job using templates"""
-        outputs = {}
+    def _generate_via_batch(self, client, model, combined_profile, templates, total_jobs):
+        """Generate all content through the Message Batches API (runs in thread)"""
+        cv_template, cover_template, talking_template = templates
+        template_specs = [
+            ('CV', cv_template, 4000),
+            ('CoverLetter', cover_template, 2000),
+            ('TalkingPoints', talking_template, 2000),
+        ]
 
-        # Generate CV
-        if cv_template:
-            cv_prompt = self.fill_template(cv_template, profile, job_data, company_info)
-            if cv_prompt:
-                response = client.messages.create(
-                    model=model,
-                    max_tokens=4000,
-                    messages=[{"role": "user", "content": cv_prompt}]
-                )
-                outputs['CV'] = response.content[0].text
+        self.root.after(0, self.log, "\nBatch mode: building requests...", "blue")
+        if self.research_company_var.get():
+            self.root.after(0, self.log, "ℹ Company research is skipped in batch mode", "gray")
 
-        # Generate cover letter
-        if cover_template:
-            cover_prompt = self.fill_template(cover_template, profile, job_data, company_info)
-            if cover_prompt:
-                response = client.messages.create(
-                    model=model,
-                    max_tokens=2000,
-                    messages=[{"role": "user", "content": cover_prompt}]
-                )
-                outputs['CoverLetter'] = response.content[0].text
+        # Build one request per (job, content type)
+        requests = []
+        id_map = {}
+        for i, job_filepath in enumerate(self.job_files, 1):
+            job_filename = os.path.basename(job_filepath)
+            try:
+                job_data = load_json_file(job_filepath)
+            except Exception as e:
+                self.root.after(0, self.log, f"  ✗ Failed to load {job_filename}: {str(e)}", "red")
+                continue
+
+            if 'error' in job_data:
+                self.root.after(0, self.log, f"  ⚠ Skipping {job_filename} (error in job data)", "orange")
+                continue
+
+            base_name = os.path.splitext(job_filename)[0]
+            for content_type, template, max_tokens in template_specs:
+                if not template:
+                    continue
+                # Same static/dynamic split as the live path: the profile
+                # prefix goes into a cached system block, so even inside a
+                # batch the N jobs share one cached prefix per template
+                system, user = self.fill_template_prompt(template, combined_profile, job_data)
+                custom_id = f"job{i}_{content_type}"
+                id_map[custom_id] = f"{base_name}_{content_type}.txt"
+                params = {
+                    'model': model,
+                    'max_tokens': max_tokens,
+                    'messages': [{"role": "user", "content": user}],
+                }
+                if system:
+                    params['system'] = system
+                requests.append({'custom_id': custom_id, 'params': params})
+
+        if not requests:
+            self.root.after(0, self.log, "⚠ No batch requests to submit", "orange")
+            return
 
-        # Generate talking points
-        if talking_template:
-            talking_prompt = self.fill_template(talking_template, profile, job_data, company_info)
-            if talking_prompt:
-                response = client.messages.create(
-                    model=model,
-                    max_tokens=2000,
-                    messages=[{"role": "user", "content": talking_prompt}]
+        batch = client.messages.batches.create(requests=requests)
+        self.root.after(0, self.log, f"✓ Submitted batch {batch.id} ({len(requests)} request(s))", "green")
+
+        # Poll until the batch finishes, reflecting counts in the progressbar
+        while True:
+            if not self.processing:
+                self.root.after(0, self.log, "Cancelling batch...", "orange")
+                client.messages.batches.cancel(batch.id)
+                return
+
+            batch = client.messages.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            done = counts.succeeded + counts.errored + counts.canceled + counts.expired
+            progress = int((done / len(requests)) * 100)
+            self.root.after(0, self.progress_var.set, progress)
+            self.root.after(0, self.progress_text.config, {"text": f"{done} / {len(requests)} requests processed"})
+
+            if batch.processing_status == "ended":
+                break
+            time.sleep(5)
+
+        # Stream results and write each file
+        saved = 0
+        for result in client.messages.batches.results(batch.id):
+            output_filename = id_map.get(result.custom_id, f"{result.custom_id}.txt")
+            if result.result.type == "succeeded":
+                content = result.result.message.content[0].text
+                output_path = os.path.join(self.current_output_folder, output_filename)
+                try:
+                    write_text_file(output_path, content)
+                    saved += 1
+                    self.root.after(0, self.log, f"  ✓ Saved: {output_filename}", "green")
+                except Exception as save_error:
+                    self.root.after(0, self.log, f"  ✗ Save Error: {str(save_error)}", "red")
+            else:
+                self.root.after(0, self.log, f"  ✗ {result.custom_id}: {result.result.type}", "red")
+
+        self.root.after(0, self.log, f"✓ Batch complete: {saved}/{len(requests)} file(s) saved", "green")
+
+    @staticmethod
+    def _job_content_key(job_data):
+        """Hash of a job's normalized content, or None if not comparable"""
+        if not isinstance(job_data, dict) or '_load_error' in job_data or 'error' in job_data:
+            return None
+        description = job_data.get('description')
+        if not description:
+            return None
+        raw = ' '.join(
+            str(job_data.get(k, '')) for k in ('job_title', 'company', 'description'))
+        return hashlib.sha256(' '.join(raw.split()).lower().encode()).hexdigest()
+
+    def _copy_job_outputs(self, rep_idx, dup_idx, total_jobs, progress_lock):
+        """Copy a representative job's generated files to a duplicate listing"""
+        rep_base = os.path.splitext(os.path.basename(self.job_files[rep_idx]))[0]
+        dup_base = os.path.splitext(os.path.basename(self.job_files[dup_idx]))[0]
+
+        copied = 0
+        for content_type in ('CV', 'CoverLetter', 'TalkingPoints'):
+            src = os.path.join(self.current_output_folder, f"{rep_base}_{content_type}.txt")
+            if os.path.exists(src):
+                try:
+                    shutil.copyfile(
+                        src, os.path.join(self.current_output_folder, f"{dup_base}_{content_type}.txt"))
+                    copied += 1
+                except OSError as copy_error:
+                    self.root.after(0, self.log, f"  ✗ Copy error: {str(copy_error)}", "red")
+
+        if copied:
+            self.root.after(0, self.log,
+                            f"  ✓ {dup_base}: copied {copied} file(s) from duplicate listing", "green")
+
+        with progress_lock:
+            self._generated_count += 1
+            done = self._generated_count
+        progress = int((done / total_jobs) * 100)
+        self.root.after(0, self.progress_var.set, progress)
+        self.root.after(0, self.progress_text.config, {"text": f"{done} / {total_jobs} CVs generated"})
+
+    def _generate_one(self, client, model, combined_profile, job_filepath, job_data, i, templates, total_jobs, progress_lock):
+        """Generate all content for one pre-parsed job (runs on a worker thread)"""
+        if not self.processing:
+            return
+
+        cv_template, cover_template, talking_template = templates
+        job_filename = os.path.basename(job_filepath)
+        dprint(f"DEBUG: [{i}/{total_jobs}] Processing job: {job_filename}")  # DEBUG
+        self.root.after(0, self.log, f"\n[{i}/{total_jobs}] Processing: {job_filename}", "blue")
+
+        try:
+            if '_load_error' in job_data:
+                self.root.after(0, self.log, f"  ✗ Failed to load: {job_data['_load_error']}", "red")
+                return
+
+            if 'error' in job_data:
+                self.root.after(0, self.log, f"  ⚠ Skipping (error in job data)", "orange")
+                return
+
+            # Research company if enabled
+            company_info = None
+            if self.research_company_var.get():
+                company_name = job_data.get('company', 'Unknown Company')
+                if company_name and company_name != 'Unknown Company':
+                    self.root.after(0, self.log, f"  🔍 Researching {company_name}...", "blue")
+                    try:
+                        company_info = self.research_company(company_name, client, model)
+                        if company_info:
+                            self.root.after(0, self.log, f"  ✓ Company research completed", "green")
+                        else:
+                            self.root.after(0, self.log, f"  ℹ No specific company info found", "gray")
+                    except Exception as research_error:
+                        self.root.after(0, self.log, f"  ⚠ Company research failed: {str(research_error)}", "orange")
+
+            # Bail between phases so Stop takes effect mid-job, not only
+            # at the next job boundary
+            if self._stop_event.is_set():
+                return
+
+            # Generate content
+            self.root.after(0, self.log, f"  Analyzing job and generating content...", "gray")
+
+            try:
+                outputs = self.generate_for_job(
+                    client, model, combined_profile, job_data,
+                    cv_template, cover_template, talking_template, company_info
                 )
-                outputs['TalkingPoints'] = response.content[0].text
+                dprint(f"DEBUG: Generated {len(outputs)} outputs")  # DEBUG
+            except Exception as api_error:
+                dprint(f"DEBUG: API error: {api_error}")  # DEBUG
+                self.root.after(0, self.log, f"  ✗ API Error: {str(api_error)}", "red")
+                import traceback
+                dprint(traceback.format_exc())  # DEBUG
+                self.root.after(0, self.log, f"  Details: {traceback.format_exc()}", "red")
+                return
+
+            # Save outputs
+            base_name = os.path.splitext(job_filename)[0]
+
+            if not outputs:
+                self.root.after(0, self.log, f"  ⚠ No content generated", "orange")
+                return
+
+            for content_type, content in outputs.items():
+                if content:
+                    output_filename = f"{base_name}_{content_type}.txt"
+                    output_path = os.path.join(self.current_output_folder, output_filename)
+
+                    dprint(f"DEBUG: Saving {content_type} to {output_path}")  # DEBUG
+                    try:
+                        write_text_file(output_path, content)
+                        dprint(f"DEBUG: File saved successfully, size: {len(content)} chars")  # DEBUG
+                        self.root.after(0, self.log, f"  ✓ Saved: {output_filename}", "green")
+                    except Exception as save_error:
+                        dprint(f"DEBUG: Save error: {save_error}")  # DEBUG
+                        self.root.after(0, self.log, f"  ✗ Save Error: {str(save_error)}", "red")
+
+        except Exception as e:
+            self.root.after(0, self.log, f"  ✗ Error processing job: {str(e)}", "red")
+            import traceback
+            self.root.after(0, self.log, f"  Full traceback: {traceback.format_exc()}", "red")
+
+        finally:
+            # Update progress as jobs complete (completion order)
+            with progress_lock:
+                self._generated_count += 1
+                done = self._generated_count
+            progress = int((done / total_jobs) * 100)
+            self.root.after(0, self.progress_var.set, progress)
+            self.root.after(0, self.progress_text.config, {"text": f"{done} / {total_jobs} CVs generated"})
+
+    def generate_for_job(self, client, model, profile, job_data, cv_template, cover_template, talking_template, company_info=None):
+        """Generate customized content for one job using templates.
+
+        The CV, cover letter and talking points calls are independent, so
+        they are issued concurrently — each blocks for seconds on the API,
+        and overlapping them cuts per-job wall-clock to the slowest call.
+        """
+        requested = [
+            ('CV', cv_template, 4000),
+            ('CoverLetter', cover_template, 2000),
+            ('TalkingPoints', talking_template, 2000),
+        ]
+        requested = [(k, t, n) for k, t, n in requested if t]
+        if not requested:
+            return {}
+
+        def generate_one(template, max_tokens):
+            if self._stop_event.is_set():
+                return None
+            system, user = self.fill_template_prompt(template, profile, job_data, company_info)
+            response = self._create_message(client, model, max_tokens, user, system=system, stream=True)
+            return response.content[0].text
+
+        outputs = {}
+        with ThreadPoolExecutor(max_workers=len(requested)) as executor:
+            futures = {
+                key: executor.submit(generate_one, template, max_tokens)
+                for key, template, max_tokens in requested
+            }
+            for key, future in futures.items():
+                outputs[key] = future.result()
 
         return outputs
 
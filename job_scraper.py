@@ -4,26 +4,278 @@ Extracts structured information from job posting URLs for AI consumption.
 Supports both simple HTTP requests and Selenium for JavaScript-heavy sites.
 """
 
+import atexit
+import importlib.util
+import os
 import requests
 import json
 import re
-import time
+import threading
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
-# Selenium imports (optional)
+# selectolax (optional): Cython-backed parser, much faster than
+# BeautifulSoup for whole-page text extraction
 try:
-    from selenium import webdriver
-    from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from webdriver_manager.chrome import ChromeDriverManager
-    SELENIUM_AVAILABLE = True
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
 except ImportError:
-    SELENIUM_AVAILABLE = False
+    SELECTOLAX_AVAILABLE = False
+
+# orjson (optional): Rust JSON serializer, much faster than stdlib json
+# for large scrape batches
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pyahocorasick (optional): one pass over the page text for all
+# keywords instead of one full scan per keyword
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Selenium (optional): importing it costs a noticeable chunk of module
+# startup, so only probe for it here and import lazily where a driver
+# is actually created
+SELENIUM_AVAILABLE = (
+    importlib.util.find_spec('selenium') is not None
+    and importlib.util.find_spec('webdriver_manager') is not None
+)
+
+
+# XPath selector lists for the field extractors. Class matching uses the
+# EXSLT regular-expressions extension so the old regex class matchers
+# keep their semantics while the scan itself runs inside libxml2 instead
+# of a Python tree walk. Expressions are compiled on first use (see
+# JobScraper._xpath).
+_EXSLT_RE_NS = {'re': 'http://exslt.org/regular-expressions'}
+
+_TITLE_XPS = (
+    '//h1[re:test(@class, "job.*title", "i")]',
+    '//h1[re:test(@class, "title", "i")]',
+    '//h1',
+    '//h2[re:test(@class, "job.*title", "i")]',
+    '//meta[@property="og:title"]/@content',
+    '//title',
+)
+_COMPANY_XPS = (
+    '//span[re:test(@class, "company", "i")]',
+    '//div[re:test(@class, "company", "i")]',
+    '//a[re:test(@class, "company", "i")]',
+    '//meta[@property="og:site_name"]/@content',
+)
+_LOCATION_XPS = (
+    '//span[re:test(@class, "location", "i")]',
+    '//div[re:test(@class, "location", "i")]',
+    '//p[re:test(@class, "location", "i")]',
+)
+_SALARY_XPS = (
+    '//span[re:test(@class, "salary|compensation|pay", "i")]',
+    '//div[re:test(@class, "salary|compensation|pay", "i")]',
+)
+_JOB_TYPE_XPS = (
+    '//span[re:test(@class, "job.*type|employment.*type|work.*type", "i")]',
+    '//div[re:test(@class, "job.*type|employment.*type|work.*type", "i")]',
+)
+_DESCRIPTION_XPS = (
+    '//div[re:test(@class, "job.*description|description", "i")]',
+    '//section[re:test(@class, "job.*description|description", "i")]',
+    '//div[re:test(@id, "job.*description|description", "i")]',
+)
+_POSTED_DATE_XPS = (
+    '//time',
+    '//span[re:test(@class, "date|posted", "i")]',
+    '//div[re:test(@class, "date|posted", "i")]',
+)
+
+_SALARY_RE = re.compile(r'\$[\d,]+(?:\s*-\s*\$[\d,]+)?(?:\s*(?:per|/|\+)\s*(?:year|hour|month|annum))?', re.I)
+_DEADLINE_RE = re.compile(r'(?:deadline|apply by|closes on)[:\s]+([^\n]+)', re.I)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'\b(?:\+?61|0)[2-478](?:[ -]?[0-9]){8}\b')
+_EDUCATION_RE = re.compile(
+    r'\b(?:bachelor|master|phd|mba|associate|diploma|degree)(?:\'s)?\s+(?:degree|in|of)?\s+[^\n.]+',
+    re.I
+)
+_XML_DECL_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+
+def _parse_root(page_html):
+    """Parse fetched HTML (bytes or str) into an lxml document root.
+
+    lxml refuses str input that still carries an <?xml ... encoding=?>
+    prolog, which XHTML pages ship, so drop the prolog from pages that
+    were already decoded; bytes parse as-is.
+    """
+    if isinstance(page_html, str):
+        page_html = _XML_DECL_RE.sub('', page_html, count=1)
+    return lxml_html.fromstring(page_html)
+
+# One alternation finds any experience level in a single pass; the named
+# group that matched identifies the level
+_EXPERIENCE_LEVEL_RE = re.compile(
+    r'(?P<entry>\b(?:entry[- ]level|junior|graduate|0-2 years|early career)\b)'
+    r'|(?P<mid>\b(?:mid[- ]level|intermediate|2-5 years)\b)'
+    r'|(?P<senior>\b(?:senior|lead|5\+ years|experienced)\b)'
+    r'|(?P<executive>\b(?:executive|director|c-level|vp)\b)',
+    re.I
+)
+_EXPERIENCE_LEVEL_NAMES = {
+    'entry': 'Entry Level',
+    'mid': 'Mid Level',
+    'senior': 'Senior Level',
+    'executive': 'Executive',
+}
+
+# One alternation classifies a header against all four section
+# categories in a single scan; each named group is a category and
+# finditer reports every category mentioned in the header
+_HEADER_DISPATCH_RE = re.compile(
+    r"(?P<requirements>requirement|qualification|must have|essential|you will have|you'll have)"
+    r"|(?P<responsibilities>responsibilit|duties|you will|role|day to day|what you'll do)"
+    r"|(?P<benefits>benefit|perk|we offer|what we offer|why join)"
+    r"|(?P<skills>skill|technical|competenc|experience with)"
+)
+_SECTION_CATEGORIES = tuple(_HEADER_DISPATCH_RE.groupindex)
+_JOB_TYPES = ('full-time', 'part-time', 'contract', 'temporary', 'internship', 'freelance', 'casual', 'permanent')
+_REMOTE_KEYWORDS = ('remote', 'work from home', 'wfh', 'telecommute', 'virtual', 'hybrid', 'flexible location')
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+def build_session(user_agent: Optional[str] = None) -> requests.Session:
+    """Build a requests session tuned for scraping.
+
+    A larger mounted pool keeps sockets alive across many requests to
+    the same host (common when scraping one job board), amortizing
+    TCP+TLS handshakes. Callers that run several scrapers can build one
+    session here and pass it to each JobScraper so they all share it.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=2,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': user_agent or DEFAULT_USER_AGENT,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    })
+    return session
+
+
+def _build_automaton(keywords):
+    """Build an Aho-Corasick automaton matching any of the keywords."""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+if AHOCORASICK_AVAILABLE:
+    _JOB_TYPE_AC = _build_automaton(_JOB_TYPES)
+    _REMOTE_AC = _build_automaton(_REMOTE_KEYWORDS)
+else:
+    _JOB_TYPE_AC = None
+    _REMOTE_AC = None
+
+
+class _DriverPool:
+    """Shares warm Chrome sessions and one chromedriver service process.
+
+    Launching headless Chrome costs multiple seconds, and resolving the
+    chromedriver binary through webdriver-manager adds more on top, so
+    paying either cost per scrape (or per batch) dominates Selenium wall
+    time. The pool starts the service once, attaches sessions to it via
+    webdriver.Remote, and parks released drivers for the next scrape
+    instead of quitting them. Drivers are keyed by the options that
+    shaped them so a headless session is never handed to a headed caller.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle: List[tuple] = []
+        self._service = None
+        self._driver_path = None
+
+    def _ensure_service(self):
+        """Start the shared chromedriver service on first use."""
+        if self._service is None:
+            from selenium.webdriver.chrome.service import Service
+            if self._driver_path is None:
+                from webdriver_manager.chrome import ChromeDriverManager
+                self._driver_path = ChromeDriverManager().install()
+            service = Service(self._driver_path)
+            service.start()
+            self._service = service
+        return self._service
+
+    def acquire(self, options, key):
+        """Return a warm driver for these options, creating one if needed."""
+        from selenium import webdriver
+        with self._lock:
+            for i, (idle_key, driver) in enumerate(self._idle):
+                if idle_key == key:
+                    del self._idle[i]
+                    return driver
+            service = self._ensure_service()
+        return webdriver.Remote(command_executor=service.service_url, options=options)
+
+    def release(self, driver, key):
+        """Park a driver for reuse by the next scrape with the same options."""
+        with self._lock:
+            self._idle.append((key, driver))
+
+    def shutdown(self):
+        """Quit all parked drivers and stop the shared service."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            service, self._service = self._service, None
+        for _, driver in idle:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        if service is not None:
+            service.stop()
+
+
+# The pool touches selenium only once a driver is requested, so it is
+# safe to create even when selenium is not installed
+_driver_pool = _DriverPool()
+atexit.register(_driver_pool.shutdown)
+
+
+# Per-process scraper for ProcessPoolExecutor workers (see scrape_batch)
+_worker_scraper = None
+
+
+def _parse_and_extract(url: str, page_html) -> Dict[str, Any]:
+    """Worker entry point: parse fetched HTML and extract job data.
+
+    Module-level so ProcessPoolExecutor can pickle it; each worker
+    process keeps one scraper alive for its whole lifetime.
+    """
+    global _worker_scraper
+    if _worker_scraper is None:
+        _worker_scraper = JobScraper()
+    return _worker_scraper.extract_from_html(page_html, url)
 
 
 class JobScraper:
@@ -32,7 +284,8 @@ class JobScraper:
     Supports both simple HTTP requests and Selenium-based scraping.
     """
 
-    def __init__(self, use_selenium: bool = False, headless: bool = True, user_agent: Optional[str] = None):
+    def __init__(self, use_selenium: bool = False, headless: bool = True, user_agent: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the JobScraper.
 
@@ -40,27 +293,33 @@ class JobScraper:
             use_selenium: Use Selenium WebDriver for JavaScript-heavy sites
             headless: Run browser in headless mode (no GUI)
             user_agent: Custom user agent string. If None, uses default.
+            session: Shared requests.Session to fetch through. If None,
+                the scraper builds (and owns) its own. Passing one lets
+                several scrapers reuse the same warm connections.
         """
         self.use_selenium = use_selenium
         self.headless = headless
-        self.user_agent = user_agent or (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
+        self.user_agent = user_agent or DEFAULT_USER_AGENT
 
-        # Initialize requests session
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': self.user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
+        # An injected session stays open when this scraper closes; an
+        # owned one is built here and released in close()
+        self._owns_session = session is None
+        self.session = session if session is not None else build_session(self.user_agent)
 
         # Selenium driver (initialized on first use)
         self.driver = None
 
+        # Validators and page bodies from earlier fetches, keyed by URL,
+        # so re-scrapes can revalidate with a conditional request and
+        # skip the transfer when the page has not changed
+        self._response_cache: Dict[str, tuple] = {}
+
+        # Compiled XPath evaluators, keyed by expression. Kept per
+        # instance rather than module-global because lxml evaluators are
+        # not safe to share between threads, and scrape_many gives each
+        # worker thread its own scraper.
+        self._xpath_cache: Dict[str, etree.XPath] = {}
+
         if use_selenium and not SELENIUM_AVAILABLE:
             raise ImportError(
                 "Selenium is not installed. Install with: pip install selenium webdriver-manager"
@@ -71,23 +330,43 @@ class JobScraper:
         if self.driver is not None:
             return
 
+        from selenium.webdriver.chrome.options import Options
+
         chrome_options = Options()
+        # Return from driver.get() once the DOM is ready instead of
+        # waiting for every subresource to finish loading
+        chrome_options.set_capability('pageLoadStrategy', 'eager')
         if self.headless:
             chrome_options.add_argument('--headless=new')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
         chrome_options.add_argument(f'user-agent={self.user_agent}')
 
-        # Disable images and CSS for faster loading (optional)
+        # The scraper only reads DOM text, so skip everything visual:
+        # images, stylesheets, fonts, plugins, popups and notifications
         prefs = {
             'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+            'profile.managed_default_content_settings.plugins': 2,
+            'profile.managed_default_content_settings.popups': 2,
+            'profile.managed_default_content_settings.notifications': 2,
+            'profile.default_content_setting_values.cookies': 1,
         }
         chrome_options.add_experimental_option('prefs', prefs)
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--disable-sync')
+        chrome_options.add_argument('--disable-features=Translate,MediaRouter')
+
+        self.driver = _driver_pool.acquire(chrome_options, self._driver_key())
 
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.implicitly_wait(10)
+    def _driver_key(self):
+        """Pool key covering every option that shapes a Chrome session."""
+        return (self.headless, self.user_agent)
 
     def scrape(self, url: str, wait_time: int = 5) -> Dict[str, Any]:
         """
@@ -106,13 +385,11 @@ class JobScraper:
             else:
                 soup = self._scrape_with_requests(url)
 
-            # Detect site and use appropriate extractors
-            if 'seek.com.au' in url:
-                job_data = self._extract_seek_au(soup, url)
-            else:
-                job_data = self._extract_generic(soup, url)
+            # Second, much cheaper parse of the same HTML into lxml so
+            # the field extractors can run precompiled XPath in C
+            root = _parse_root(self._page_html)
 
-            return job_data
+            return self._dispatch_extract(soup, root, url)
 
         except Exception as e:
             return {
@@ -121,27 +398,345 @@ class JobScraper:
                 'scraped_at': datetime.utcnow().isoformat()
             }
 
+    def _dispatch_extract(self, soup: BeautifulSoup, root, url: str) -> Dict[str, Any]:
+        """Run the site-appropriate extractors over the parsed page."""
+        # A JSON-LD JobPosting block, when present, supplies most
+        # structured fields from one small JSON parse; the DOM
+        # extractors only fill in what it leaves out
+        ld_fields = self._json_ld_fields(root)
+
+        if 'seek.com.au' in url:
+            return self._extract_seek_au(soup, root, url, ld_fields)
+        return self._extract_generic(soup, root, url, ld_fields)
+
+    def extract_from_html(self, page_html, url: str) -> Dict[str, Any]:
+        """
+        Extract structured job data from already-fetched HTML.
+
+        Args:
+            page_html: The page source (bytes or str)
+            url: The URL the page came from, used for site detection
+
+        Returns:
+            Dictionary containing structured job information
+        """
+        try:
+            self._page_html = page_html
+            soup = BeautifulSoup(page_html, 'lxml')
+            root = _parse_root(page_html)
+            return self._dispatch_extract(soup, root, url)
+        except Exception as e:
+            return {
+                'error': f'Error processing page: {str(e)}',
+                'url': url,
+                'scraped_at': datetime.utcnow().isoformat()
+            }
+
+    def scrape_many(self, urls: List[str], max_workers: int = 8, wait_time: int = 5) -> List[Dict[str, Any]]:
+        """
+        Scrape several job posting URLs concurrently.
+
+        Each fetch is network-bound, so overlapping them on a thread pool
+        brings wall-clock close to the slowest single page instead of the
+        sum of all of them. A WebDriver can only load one page at a time,
+        so every worker thread gets its own scraper instance.
+
+        Args:
+            urls: URLs of the job postings to scrape
+            max_workers: Maximum number of concurrent fetches
+            wait_time: Time to wait for each page to load (Selenium only)
+
+        Returns:
+            List of job data dictionaries, in the same order as urls
+        """
+        if not urls:
+            return []
+
+        local = threading.local()
+        spawned: List['JobScraper'] = []
+        spawned_lock = threading.Lock()
+
+        def scrape_one(url: str) -> Dict[str, Any]:
+            scraper = getattr(local, 'scraper', None)
+            if scraper is None:
+                scraper = JobScraper(
+                    use_selenium=self.use_selenium,
+                    headless=self.headless,
+                    user_agent=self.user_agent,
+                )
+                local.scraper = scraper
+                with spawned_lock:
+                    spawned.append(scraper)
+            return scraper.scrape(url, wait_time=wait_time)
+
+        try:
+            workers = min(max_workers, len(urls))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(scrape_one, urls))
+        finally:
+            for scraper in spawned:
+                scraper.close()
+
+    def scrape_batch(self, urls: List[str], workers: Optional[int] = None,
+                     max_fetchers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Scrape many URLs with fetching and parsing parallelized separately.
+
+        Fetches are network-bound and overlap on a thread pool, while
+        parsing and regex scanning are CPU-bound and serialize on the
+        GIL, so the raw pages are handed to a ProcessPoolExecutor where
+        each page extracts on its own core. Requests-only; use
+        scrape_many for Selenium workloads.
+
+        Args:
+            urls: URLs of the job postings to scrape
+            workers: Parser processes (defaults to the CPU count)
+            max_fetchers: Maximum number of concurrent fetches
+
+        Returns:
+            List of job data dictionaries, in the same order as urls
+        """
+        if not urls:
+            return []
+
+        def fetch(url: str):
+            try:
+                response = self.session.get(url, timeout=30)
+                response.raise_for_status()
+                return response.content
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(max_fetchers, len(urls))) as pool:
+            pages = list(pool.map(fetch, urls))
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            for i, (url, page) in enumerate(zip(urls, pages)):
+                if isinstance(page, Exception):
+                    results[i] = {
+                        'error': f'Error processing page: {page}',
+                        'url': url,
+                        'scraped_at': datetime.utcnow().isoformat(),
+                    }
+                else:
+                    futures[pool.submit(_parse_and_extract, url, page)] = i
+            for future, i in futures.items():
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    results[i] = {
+                        'error': f'Error processing page: {e}',
+                        'url': urls[i],
+                        'scraped_at': datetime.utcnow().isoformat(),
+                    }
+        return results
+
     def _scrape_with_requests(self, url: str) -> BeautifulSoup:
-        """Scrape using simple HTTP requests."""
-        response = self.session.get(url, timeout=30)
+        """Scrape using simple HTTP requests.
+
+        Pages seen before are revalidated with If-None-Match /
+        If-Modified-Since; a 304 reuses the cached body instead of
+        re-downloading it.
+        """
+        cached = self._response_cache.get(url)
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        response = self.session.get(url, timeout=30, headers=headers or None)
+        if response.status_code == 304 and cached:
+            self._page_html = cached[2]
+            return BeautifulSoup(self._page_html, 'lxml')
         response.raise_for_status()
-        return BeautifulSoup(response.content, 'lxml')
+        # When the server declares a charset, decode once here so none of
+        # the parsers (bs4, lxml, selectolax) has to sniff the encoding of
+        # the raw bytes. Without a declared charset requests defaults to
+        # latin-1, which would decode anything, so only trust an explicit
+        # header and otherwise let the parsers detect it themselves.
+        if 'charset' in response.headers.get('Content-Type', '').lower():
+            self._page_html = response.content.decode(response.encoding, errors='replace')
+        else:
+            self._page_html = response.content
+
+        # Remember the body when the server hands out a validator
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            if len(self._response_cache) >= 1024:
+                self._response_cache.clear()
+            self._response_cache[url] = (etag, last_modified, self._page_html)
+
+        return BeautifulSoup(self._page_html, 'lxml')
 
     def _scrape_with_selenium(self, url: str, wait_time: int = 5) -> BeautifulSoup:
         """Scrape using Selenium WebDriver."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         self._init_selenium_driver()
         self.driver.get(url)
 
-        # Wait for page to load
-        time.sleep(wait_time)
+        # Wait for the job content to appear rather than sleeping a fixed
+        # interval; a loaded page continues immediately
+        try:
+            WebDriverWait(self.driver, wait_time).until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, '[data-automation="job-detail-title"], h1')
+                )
+            )
+        except Exception:
+            # Generic sites without an h1 still get whatever has rendered
+            # by the deadline
+            pass
 
         # Get page source after JavaScript execution
         page_source = self.driver.page_source
+        self._page_html = page_source
         return BeautifulSoup(page_source, 'lxml')
 
-    def _extract_seek_au(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _xpath(self, expr: str) -> etree.XPath:
+        """Return a compiled XPath evaluator, compiling once per expression."""
+        evaluator = self._xpath_cache.get(expr)
+        if evaluator is None:
+            evaluator = etree.XPath(expr, namespaces=_EXSLT_RE_NS)
+            self._xpath_cache[expr] = evaluator
+        return evaluator
+
+    def _first_xpath_text(self, root, exprs) -> Optional[str]:
+        """Return the first non-empty text matched by a list of XPath expressions.
+
+        Attribute selections come back as strings and are returned as-is;
+        element matches are reduced with text_content().
+        """
+        for expr in exprs:
+            for result in self._xpath(expr)(root):
+                text = result if isinstance(result, str) else result.text_content()
+                text = text.strip()
+                if text:
+                    return text
+        return None
+
+    def _json_ld_fields(self, root) -> Dict[str, Any]:
+        """Map an embedded schema.org JobPosting onto job_data fields.
+
+        Seek and most ATS pages ship a JSON-LD script that already
+        carries the title, company, location, salary and dates, so one
+        JSON parse replaces a selector walk per field. Returns an empty
+        dict when no JobPosting block is found.
+        """
+        posting = None
+        for script in self._xpath('//script[@type="application/ld+json"]')(root):
+            raw = script.text
+            if not raw:
+                continue
+            try:
+                data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+            except ValueError:
+                continue
+            if isinstance(data, dict):
+                candidates = data.get('@graph') if isinstance(data.get('@graph'), list) else [data]
+            elif isinstance(data, list):
+                candidates = data
+            else:
+                continue
+            for item in candidates:
+                if isinstance(item, dict) and item.get('@type') == 'JobPosting':
+                    posting = item
+                    break
+            if posting:
+                break
+        if posting is None:
+            return {}
+
+        fields: Dict[str, Any] = {}
+        if posting.get('title'):
+            fields['job_title'] = str(posting['title']).strip()
+        organization = posting.get('hiringOrganization')
+        if isinstance(organization, dict):
+            organization = organization.get('name')
+        if organization:
+            fields['company'] = str(organization).strip()
+        location = self._json_ld_location(posting.get('jobLocation'))
+        if location:
+            fields['location'] = location
+        salary = self._json_ld_salary(posting.get('baseSalary'))
+        if salary:
+            fields['salary'] = salary
+        employment = posting.get('employmentType')
+        if isinstance(employment, list) and employment:
+            employment = employment[0]
+        if employment:
+            fields['job_type'] = str(employment).replace('_', '-').title()
+        if posting.get('datePosted'):
+            fields['posted_date'] = str(posting['datePosted'])
+        if posting.get('validThrough'):
+            fields['application_deadline'] = str(posting['validThrough'])
+        description = posting.get('description')
+        if description:
+            text = str(description)
+            if '<' in text:
+                text = lxml_html.fromstring(text).text_content()
+            fields['description'] = ' '.join(text.split())
+        return fields
+
+    @staticmethod
+    def _json_ld_location(value) -> Optional[str]:
+        """Render a JobPosting jobLocation entry as a plain string."""
+        if isinstance(value, list):
+            value = value[0] if value else None
+        if isinstance(value, dict):
+            address = value.get('address', value)
+            if isinstance(address, dict):
+                parts = [
+                    address.get('addressLocality'),
+                    address.get('addressRegion'),
+                    address.get('addressCountry'),
+                ]
+                return ', '.join(p for p in parts if isinstance(p, str) and p) or None
+            value = address
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+        return None
+
+    @staticmethod
+    def _json_ld_salary(value) -> Optional[str]:
+        """Render a JobPosting baseSalary entry as a plain string."""
+        if isinstance(value, (int, float, str)):
+            return str(value) or None
+        if not isinstance(value, dict):
+            return None
+        inner = value.get('value', value)
+        if isinstance(inner, (int, float, str)):
+            return str(inner) or None
+        if not isinstance(inner, dict):
+            return None
+        minimum, maximum = inner.get('minValue'), inner.get('maxValue')
+        if minimum is not None and maximum is not None:
+            text = f'{minimum} - {maximum}'
+        else:
+            amount = inner.get('value', minimum if minimum is not None else maximum)
+            if amount is None:
+                return None
+            text = str(amount)
+        unit = inner.get('unitText')
+        if unit:
+            text = f'{text} per {str(unit).lower()}'
+        return text
+
+    def _extract_seek_au(self, soup: BeautifulSoup, root, url: str,
+                         ld_fields: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Extract job information specifically for seek.com.au."""
 
+        ld = ld_fields or {}
+
         # Seek.com.au specific selectors
         job_data = {
             'url': url,
@@ -150,43 +745,46 @@ class JobScraper:
         }
 
         # Job title
-        title_elem = soup.find('h1', {'data-automation': 'job-detail-title'})
-        if not title_elem:
-            title_elem = soup.find('h1')
-        job_data['job_title'] = title_elem.get_text(strip=True) if title_elem else None
+        job_data['job_title'] = ld.get('job_title') or self._first_xpath_text(root, (
+            '//h1[@data-automation="job-detail-title"]',
+            '//h1',
+        ))
 
         # Company name
-        company_elem = soup.find('span', {'data-automation': 'advertiser-name'})
-        if not company_elem:
-            company_elem = soup.find('a', {'data-automation': 'company-link'})
-        job_data['company'] = company_elem.get_text(strip=True) if company_elem else None
+        job_data['company'] = ld.get('company') or self._first_xpath_text(root, (
+            '//span[@data-automation="advertiser-name"]',
+            '//a[@data-automation="company-link"]',
+        ))
 
         # Location
-        location_elem = soup.find('span', {'data-automation': 'job-detail-location'})
-        if not location_elem:
-            location_elem = soup.find('a', {'data-automation': 'job-detail-location'})
-        job_data['location'] = location_elem.get_text(strip=True) if location_elem else None
+        job_data['location'] = ld.get('location') or self._first_xpath_text(root, (
+            '//span[@data-automation="job-detail-location"]',
+            '//a[@data-automation="job-detail-location"]',
+        ))
 
         # Salary
-        salary_elem = soup.find('span', {'data-automation': 'job-detail-salary'})
-        job_data['salary'] = salary_elem.get_text(strip=True) if salary_elem else None
+        job_data['salary'] = ld.get('salary') or self._first_xpath_text(root, (
+            '//span[@data-automation="job-detail-salary"]',
+        ))
 
         # Job type and work type
-        work_type_elem = soup.find('span', {'data-automation': 'job-detail-work-type'})
-        job_data['job_type'] = work_type_elem.get_text(strip=True) if work_type_elem else None
+        job_data['job_type'] = ld.get('job_type') or self._first_xpath_text(root, (
+            '//span[@data-automation="job-detail-work-type"]',
+        ))
 
         # Job description
-        desc_elem = soup.find('div', {'data-automation': 'jobAdDetails'})
+        desc_elem = soup.select_one('div[data-automation="jobAdDetails"]')
         if not desc_elem:
-            desc_elem = soup.find('div', class_=re.compile(r'job.*details|description', re.I))
-        job_data['description'] = desc_elem.get_text(strip=True, separator=' ') if desc_elem else None
+            desc_elem = soup.select_one(
+                'div[class*="job" i][class*="details" i], div[class*="description" i]'
+            )
+        job_data['description'] = (
+            desc_elem.get_text(strip=True, separator=' ') if desc_elem else ld.get('description')
+        )
 
         # Extract structured information from description
         if desc_elem:
-            job_data['requirements'] = self._extract_requirements(desc_elem)
-            job_data['responsibilities'] = self._extract_responsibilities(desc_elem)
-            job_data['benefits'] = self._extract_benefits(desc_elem)
-            job_data['skills'] = self._extract_skills(desc_elem)
+            job_data.update(self._extract_sections(desc_elem))
         else:
             job_data['requirements'] = None
             job_data['responsibilities'] = None
@@ -194,350 +792,256 @@ class JobScraper:
             job_data['skills'] = None
 
         # Posted date
-        posted_elem = soup.find('span', {'data-automation': 'job-detail-date'})
-        if not posted_elem:
-            posted_elem = soup.find('time')
-        if posted_elem:
-            if posted_elem.get('datetime'):
-                job_data['posted_date'] = posted_elem['datetime']
+        job_data['posted_date'] = ld.get('posted_date')
+        if not job_data['posted_date']:
+            posted_elems = self._xpath('//span[@data-automation="job-detail-date"]')(root)
+            if not posted_elems:
+                posted_elems = self._xpath('//time')(root)
+            if posted_elems:
+                posted_elem = posted_elems[0]
+                job_data['posted_date'] = posted_elem.get('datetime') or posted_elem.text_content().strip()
             else:
-                job_data['posted_date'] = posted_elem.get_text(strip=True)
-        else:
-            job_data['posted_date'] = None
-
-        # Additional fields
-        job_data['application_deadline'] = self._extract_deadline(soup)
-        job_data['contact_info'] = self._extract_contact_info(soup)
-        job_data['experience_level'] = self._extract_experience_level(soup)
-        job_data['education'] = self._extract_education(soup)
-        job_data['remote_option'] = self._detect_remote(soup)
-        job_data['raw_text'] = self._extract_raw_text(soup)
+                job_data['posted_date'] = None
+
+        # Additional fields; extract the page text once and share it between
+        # the extractors that scan it
+        page_text = root.text_content()
+        page_text_lower = page_text.lower()
+        job_data['application_deadline'] = ld.get('application_deadline') or self._extract_deadline(page_text)
+        job_data['contact_info'] = self._extract_contact_info(page_text)
+        job_data['experience_level'] = self._extract_experience_level(page_text_lower)
+        job_data['education'] = self._extract_education(page_text)
+        job_data['remote_option'] = self._detect_remote(page_text_lower)
+        job_data['raw_text'] = self._extract_raw_text(root)
 
         return job_data
 
-    def _extract_generic(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _extract_generic(self, soup: BeautifulSoup, root, url: str,
+                         ld_fields: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Extract job information using generic selectors."""
+        ld = ld_fields or {}
+        sections = self._extract_sections(soup)
+        # Extract the page text once and share it between the extractors
+        # that scan it
+        page_text = root.text_content()
+        page_text_lower = page_text.lower()
         job_data = {
             'url': url,
             'scraped_at': datetime.utcnow().isoformat(),
-            'job_title': self._extract_job_title(soup),
-            'company': self._extract_company(soup),
-            'location': self._extract_location(soup),
-            'salary': self._extract_salary(soup),
-            'job_type': self._extract_job_type(soup),
-            'description': self._extract_description(soup),
-            'requirements': self._extract_requirements(soup),
-            'responsibilities': self._extract_responsibilities(soup),
-            'benefits': self._extract_benefits(soup),
-            'posted_date': self._extract_posted_date(soup),
-            'application_deadline': self._extract_deadline(soup),
-            'contact_info': self._extract_contact_info(soup),
-            'skills': self._extract_skills(soup),
-            'experience_level': self._extract_experience_level(soup),
-            'education': self._extract_education(soup),
-            'remote_option': self._detect_remote(soup),
-            'raw_text': self._extract_raw_text(soup),
+            'job_title': ld.get('job_title') or self._extract_job_title(root),
+            'company': ld.get('company') or self._extract_company(root),
+            'location': ld.get('location') or self._extract_location(root),
+            'salary': ld.get('salary') or self._extract_salary(root, page_text),
+            'job_type': ld.get('job_type') or self._extract_job_type(root, page_text_lower),
+            'description': ld.get('description') or self._extract_description(root),
+            'requirements': sections['requirements'],
+            'responsibilities': sections['responsibilities'],
+            'benefits': sections['benefits'],
+            'posted_date': ld.get('posted_date') or self._extract_posted_date(root),
+            'application_deadline': ld.get('application_deadline') or self._extract_deadline(page_text),
+            'contact_info': self._extract_contact_info(page_text),
+            'skills': sections['skills'],
+            'experience_level': self._extract_experience_level(page_text_lower),
+            'education': self._extract_education(page_text),
+            'remote_option': self._detect_remote(page_text_lower),
+            'raw_text': self._extract_raw_text(root),
         }
 
         return job_data
 
-    def _extract_job_title(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_job_title(self, root) -> Optional[str]:
         """Extract job title from the page."""
-        selectors = [
-            ('h1', {'class': re.compile(r'job.*title', re.I)}),
-            ('h1', {'class': re.compile(r'title', re.I)}),
-            ('h1', {}),
-            ('h2', {'class': re.compile(r'job.*title', re.I)}),
-            ('meta', {'property': 'og:title'}),
-            ('title', {}),
-        ]
-
-        for tag, attrs in selectors:
-            if tag == 'meta':
-                element = soup.find(tag, attrs)
-                if element and element.get('content'):
-                    return element['content'].strip()
-            else:
-                element = soup.find(tag, attrs)
-                if element and element.get_text(strip=True):
-                    return element.get_text(strip=True)
+        return self._first_xpath_text(root, _TITLE_XPS)
 
-        return None
-
-    def _extract_company(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_company(self, root) -> Optional[str]:
         """Extract company name from the page."""
-        selectors = [
-            ('span', {'class': re.compile(r'company', re.I)}),
-            ('div', {'class': re.compile(r'company', re.I)}),
-            ('a', {'class': re.compile(r'company', re.I)}),
-            ('meta', {'property': 'og:site_name'}),
-        ]
-
-        for tag, attrs in selectors:
-            if tag == 'meta':
-                element = soup.find(tag, attrs)
-                if element and element.get('content'):
-                    return element['content'].strip()
-            else:
-                element = soup.find(tag, attrs)
-                if element and element.get_text(strip=True):
-                    return element.get_text(strip=True)
+        return self._first_xpath_text(root, _COMPANY_XPS)
 
-        return None
-
-    def _extract_location(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_location(self, root) -> Optional[str]:
         """Extract job location from the page."""
-        selectors = [
-            ('span', {'class': re.compile(r'location', re.I)}),
-            ('div', {'class': re.compile(r'location', re.I)}),
-            ('p', {'class': re.compile(r'location', re.I)}),
-        ]
-
-        for tag, attrs in selectors:
-            element = soup.find(tag, attrs)
-            if element and element.get_text(strip=True):
-                return element.get_text(strip=True)
-
-        return None
+        return self._first_xpath_text(root, _LOCATION_XPS)
 
-    def _extract_salary(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_salary(self, root, page_text: str) -> Optional[str]:
         """Extract salary information from the page."""
-        salary_pattern = re.compile(r'\$[\d,]+(?:\s*-\s*\$[\d,]+)?(?:\s*(?:per|/|\+)\s*(?:year|hour|month|annum))?', re.I)
-
-        selectors = [
-            ('span', {'class': re.compile(r'salary|compensation|pay', re.I)}),
-            ('div', {'class': re.compile(r'salary|compensation|pay', re.I)}),
-        ]
-
-        for tag, attrs in selectors:
-            element = soup.find(tag, attrs)
-            if element:
-                text = element.get_text(strip=True)
-                if text:
-                    return text
+        text = self._first_xpath_text(root, _SALARY_XPS)
+        if text:
+            return text
 
         # Search entire page for salary pattern
-        page_text = soup.get_text()
-        match = salary_pattern.search(page_text)
+        match = _SALARY_RE.search(page_text)
         if match:
             return match.group(0)
 
         return None
 
-    def _extract_job_type(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_job_type(self, root, page_text_lower: str) -> Optional[str]:
         """Extract job type (full-time, part-time, contract, etc.)."""
-        job_types = ['full-time', 'part-time', 'contract', 'temporary', 'internship', 'freelance', 'casual', 'permanent']
-
-        selectors = [
-            ('span', {'class': re.compile(r'job.*type|employment.*type|work.*type', re.I)}),
-            ('div', {'class': re.compile(r'job.*type|employment.*type|work.*type', re.I)}),
-        ]
-
-        for tag, attrs in selectors:
-            element = soup.find(tag, attrs)
-            if element:
-                text = element.get_text(strip=True).lower()
-                for job_type in job_types:
+        for expr in _JOB_TYPE_XPS:
+            for element in self._xpath(expr)(root):
+                text = element.text_content().lower()
+                for job_type in _JOB_TYPES:
                     if job_type in text:
                         return job_type.title()
 
-        # Search page text
-        page_text = soup.get_text().lower()
-        for job_type in job_types:
-            if job_type in page_text:
+        # Search page text: a single automaton pass when available,
+        # otherwise one scan per job type
+        if _JOB_TYPE_AC is not None:
+            for _, job_type in _JOB_TYPE_AC.iter(page_text_lower):
                 return job_type.title()
+        else:
+            for job_type in _JOB_TYPES:
+                if job_type in page_text_lower:
+                    return job_type.title()
 
         return None
 
-    def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_description(self, root) -> Optional[str]:
         """Extract job description from the page."""
-        selectors = [
-            ('div', {'class': re.compile(r'job.*description|description', re.I)}),
-            ('section', {'class': re.compile(r'job.*description|description', re.I)}),
-            ('div', {'id': re.compile(r'job.*description|description', re.I)}),
-        ]
-
-        for tag, attrs in selectors:
-            element = soup.find(tag, attrs)
-            if element:
-                return element.get_text(strip=True, separator=' ')
+        for expr in _DESCRIPTION_XPS:
+            for element in self._xpath(expr)(root):
+                # itertext joined with a space keeps adjacent elements
+                # apart on minified HTML, matching get_text(separator=' ');
+                # text_content() would run their text together
+                text = ' '.join(' '.join(element.itertext()).split())
+                if text:
+                    return text
 
         return None
 
-    def _extract_requirements(self, soup: BeautifulSoup) -> Optional[List[str]]:
-        """Extract job requirements/qualifications."""
-        requirements = []
+    def _extract_sections(self, soup: BeautifulSoup) -> Dict[str, Optional[List[str]]]:
+        """Extract requirements, responsibilities, benefits and skills in one pass.
 
-        headers = soup.find_all(['h2', 'h3', 'h4', 'strong', 'b', 'p'])
-        for header in headers:
-            header_text = header.get_text(strip=True).lower()
-            if any(keyword in header_text for keyword in ['requirement', 'qualification', 'must have', 'essential', 'you will have', 'you\'ll have']):
-                next_elem = header.find_next(['ul', 'ol', 'div', 'p'])
-                if next_elem:
-                    if next_elem.name in ['ul', 'ol']:
-                        items = next_elem.find_all('li')
-                        requirements.extend([item.get_text(strip=True) for item in items if item.get_text(strip=True)])
-                    else:
-                        text = next_elem.get_text(strip=True)
-                        if text and text not in header_text:
-                            requirements.append(text)
-
-        return requirements if requirements else None
-
-    def _extract_responsibilities(self, soup: BeautifulSoup) -> Optional[List[str]]:
-        """Extract job responsibilities."""
-        responsibilities = []
+        These four sections all follow the same header-then-list shape, so
+        walking the headers once and classifying each against a keyword map
+        is four times cheaper than scanning the tree per section.
+        """
+        sections = {category: [] for category in _SECTION_CATEGORIES}
 
         headers = soup.find_all(['h2', 'h3', 'h4', 'strong', 'b', 'p'])
         for header in headers:
             header_text = header.get_text(strip=True).lower()
-            if any(keyword in header_text for keyword in ['responsibilit', 'duties', 'you will', 'role', 'day to day', 'what you\'ll do']):
-                next_elem = header.find_next(['ul', 'ol', 'div', 'p'])
-                if next_elem:
-                    if next_elem.name in ['ul', 'ol']:
-                        items = next_elem.find_all('li')
-                        responsibilities.extend([item.get_text(strip=True) for item in items if item.get_text(strip=True)])
-                    else:
-                        text = next_elem.get_text(strip=True)
-                        if text and text not in header_text:
-                            responsibilities.append(text)
-
-        return responsibilities if responsibilities else None
-
-    def _extract_benefits(self, soup: BeautifulSoup) -> Optional[List[str]]:
-        """Extract job benefits."""
-        benefits = []
+            matched = {m.lastgroup for m in _HEADER_DISPATCH_RE.finditer(header_text)}
+            if not matched:
+                continue
+            next_elem = header.find_next(['ul', 'ol', 'div', 'p'])
+            if not next_elem:
+                continue
+            if next_elem.name in ['ul', 'ol']:
+                items = next_elem.find_all('li')
+                # Capture each item's text once; get_text walks the subtree
+                entries = [text for text in (item.get_text(strip=True) for item in items) if text]
+            else:
+                text = next_elem.get_text(strip=True)
+                entries = [text] if text and text not in header_text else []
+            for category in matched:
+                sections[category].extend(entries)
 
-        headers = soup.find_all(['h2', 'h3', 'h4', 'strong', 'b', 'p'])
-        for header in headers:
-            header_text = header.get_text(strip=True).lower()
-            if any(keyword in header_text for keyword in ['benefit', 'perk', 'we offer', 'what we offer', 'why join']):
-                next_elem = header.find_next(['ul', 'ol', 'div', 'p'])
-                if next_elem:
-                    if next_elem.name in ['ul', 'ol']:
-                        items = next_elem.find_all('li')
-                        benefits.extend([item.get_text(strip=True) for item in items if item.get_text(strip=True)])
-                    else:
-                        text = next_elem.get_text(strip=True)
-                        if text and text not in header_text:
-                            benefits.append(text)
-
-        return benefits if benefits else None
-
-    def _extract_posted_date(self, soup: BeautifulSoup) -> Optional[str]:
+        return {category: entries if entries else None for category, entries in sections.items()}
+
+    def _extract_posted_date(self, root) -> Optional[str]:
         """Extract job posting date."""
-        selectors = [
-            ('time', {}),
-            ('span', {'class': re.compile(r'date|posted', re.I)}),
-            ('div', {'class': re.compile(r'date|posted', re.I)}),
-        ]
-
-        for tag, attrs in selectors:
-            element = soup.find(tag, attrs)
-            if element:
-                if tag == 'time' and element.get('datetime'):
-                    return element['datetime']
-                text = element.get_text(strip=True)
+        for expr in _POSTED_DATE_XPS:
+            for element in self._xpath(expr)(root):
+                if element.tag == 'time' and element.get('datetime'):
+                    return element.get('datetime')
+                text = element.text_content().strip()
                 if text:
                     return text
 
         return None
 
-    def _extract_deadline(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_deadline(self, page_text: str) -> Optional[str]:
         """Extract application deadline."""
-        page_text = soup.get_text()
-        deadline_pattern = re.compile(r'(?:deadline|apply by|closes on)[:\s]+([^\n]+)', re.I)
-        match = deadline_pattern.search(page_text)
+        match = _DEADLINE_RE.search(page_text)
         if match:
             return match.group(1).strip()
 
         return None
 
-    def _extract_contact_info(self, soup: BeautifulSoup) -> Optional[Dict[str, str]]:
+    def _extract_contact_info(self, page_text: str) -> Optional[Dict[str, str]]:
         """Extract contact information."""
         contact = {}
 
         # Extract email
-        email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        emails = email_pattern.findall(soup.get_text())
+        emails = _EMAIL_RE.findall(page_text)
         if emails:
             contact['email'] = emails[0]
 
         # Extract phone (Australian format)
-        phone_pattern = re.compile(r'\b(?:\+?61|0)[2-478](?:[ -]?[0-9]){8}\b')
-        phones = phone_pattern.findall(soup.get_text())
+        phones = _PHONE_RE.findall(page_text)
         if phones:
             contact['phone'] = phones[0]
 
         return contact if contact else None
 
-    def _extract_skills(self, soup: BeautifulSoup) -> Optional[List[str]]:
-        """Extract required skills."""
-        skills = []
-
-        headers = soup.find_all(['h2', 'h3', 'h4', 'strong', 'b', 'p'])
-        for header in headers:
-            header_text = header.get_text(strip=True).lower()
-            if any(keyword in header_text for keyword in ['skill', 'technical', 'competenc', 'experience with']):
-                next_elem = header.find_next(['ul', 'ol', 'div', 'p'])
-                if next_elem:
-                    if next_elem.name in ['ul', 'ol']:
-                        items = next_elem.find_all('li')
-                        skills.extend([item.get_text(strip=True) for item in items if item.get_text(strip=True)])
-                    else:
-                        text = next_elem.get_text(strip=True)
-                        if text and text not in header_text:
-                            skills.append(text)
-
-        return skills if skills else None
-
-    def _extract_experience_level(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_experience_level(self, page_text_lower: str) -> Optional[str]:
         """Extract experience level required."""
-        experience_keywords = {
-            'entry level': r'\b(?:entry[- ]level|junior|graduate|0-2 years|early career)\b',
-            'mid level': r'\b(?:mid[- ]level|intermediate|2-5 years)\b',
-            'senior level': r'\b(?:senior|lead|5\+ years|experienced)\b',
-            'executive': r'\b(?:executive|director|c-level|vp)\b',
-        }
-
-        page_text = soup.get_text().lower()
-        for level, pattern in experience_keywords.items():
-            if re.search(pattern, page_text, re.I):
-                return level.title()
+        match = _EXPERIENCE_LEVEL_RE.search(page_text_lower)
+        if match:
+            return _EXPERIENCE_LEVEL_NAMES[match.lastgroup]
 
         return None
 
-    def _extract_education(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_education(self, page_text: str) -> Optional[str]:
         """Extract education requirements."""
-        education_pattern = re.compile(
-            r'\b(?:bachelor|master|phd|mba|associate|diploma|degree)(?:\'s)?\s+(?:degree|in|of)?\s+[^\n.]+',
-            re.I
-        )
-
-        page_text = soup.get_text()
-        match = education_pattern.search(page_text)
+        match = _EDUCATION_RE.search(page_text)
         if match:
             return match.group(0).strip()
 
         return None
 
-    def _detect_remote(self, soup: BeautifulSoup) -> bool:
+    def _detect_remote(self, page_text_lower: str) -> bool:
         """Detect if the job offers remote work option."""
-        remote_keywords = ['remote', 'work from home', 'wfh', 'telecommute', 'virtual', 'hybrid', 'flexible location']
-        page_text = soup.get_text().lower()
+        if _REMOTE_AC is not None:
+            return next(_REMOTE_AC.iter(page_text_lower), None) is not None
+        return any(keyword in page_text_lower for keyword in _REMOTE_KEYWORDS)
 
-        return any(keyword in page_text for keyword in remote_keywords)
+    def _extract_raw_text(self, root) -> str:
+        """Extract all readable text from the page for fallback analysis.
 
-    def _extract_raw_text(self, soup: BeautifulSoup) -> str:
-        """Extract all readable text from the page for fallback analysis."""
-        # Remove script and style elements
-        for script in soup(['script', 'style', 'nav', 'footer', 'header']):
-            script.decompose()
-
-        text = soup.get_text(separator=' ', strip=True)
-        # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text)
-        return text
+        Strips the noise elements from the lxml tree in a single C pass,
+        so callers must extract raw text last.
+        """
+        # Fast path: re-parse the raw HTML with selectolax, whose tag
+        # stripping and text walk run in Cython instead of Python
+        page_html = getattr(self, '_page_html', None)
+        if SELECTOLAX_AVAILABLE and page_html is not None:
+            tree = HTMLParser(page_html)
+            tree.strip_tags(['script', 'style', 'nav', 'footer', 'header'])
+            text = tree.text(separator=' ', strip=True)
+            # HTMLParser.text() only walks the body; pull the <title> in
+            # separately so raw_text matches the lxml fallback, which
+            # sees the whole document
+            title = tree.css_first('title')
+            if title is not None:
+                title_text = title.text(strip=True)
+                if title_text:
+                    text = f'{title_text} {text}'
+            return ' '.join(text.split())
+
+        # Fallback: one strip_elements pass and one text walk in libxml2
+        etree.strip_elements(root, 'script', 'style', 'nav', 'footer', 'header', with_tail=False)
+        # itertext joined with spaces keeps adjacent elements apart on
+        # minified HTML (text_content() would run them together); the
+        # split/join then collapses whitespace runs in C
+        return ' '.join(' '.join(root.itertext()).split())
+
+    def _dump_json(self, data: Any, output_file: str):
+        """Serialize data to a JSON file, preferring orjson.
+
+        orjson emits the whole document as one bytes object in native
+        code, avoiding stdlib json's per-key Python callbacks, and the
+        single write avoids buffering churn on large batches.
+        """
+        if ORJSON_AVAILABLE:
+            serialized = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+            with open(output_file, 'wb') as f:
+                f.write(serialized)
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
 
     def save_to_json(self, job_data: Dict[str, Any], output_file: str):
         """
@@ -547,8 +1051,7 @@ class JobScraper:
             job_data: The scraped job data dictionary
             output_file: Path to the output JSON file
         """
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(job_data, f, indent=2, ensure_ascii=False)
+        self._dump_json(job_data, output_file)
 
     def save_multiple_to_json(self, jobs_data: List[Dict[str, Any]], output_file: str):
         """
@@ -558,14 +1061,19 @@ class JobScraper:
             jobs_data: List of scraped job data dictionaries
             output_file: Path to the output JSON file
         """
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(jobs_data, f, indent=2, ensure_ascii=False)
+        self._dump_json(jobs_data, output_file)
+
+    def clear_cache(self):
+        """Drop cached validators and page bodies for conditional requests."""
+        self._response_cache.clear()
 
     def close(self):
-        """Clean up resources (close Selenium driver if active)."""
+        """Release resources (return the Selenium driver to the pool)."""
         if self.driver:
-            self.driver.quit()
+            _driver_pool.release(self.driver, self._driver_key())
             self.driver = None
+        if self._owns_session:
+            self.session.close()
 
     def __enter__(self):
         """Context manager entry."""
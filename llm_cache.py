@@ -0,0 +1,68 @@
+"""
+SQLite-backed response cache for Claude API calls.
+Identical prompts (same model, prompt text and max_tokens) hit the local
+cache instead of re-paying API latency and token cost on re-runs.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cv_customizer")
+CACHE_PATH = os.path.join(CACHE_DIR, "llm_cache.sqlite")
+
+
+def make_key(model, prompt, max_tokens, system=None):
+    """Deterministic hash for one API call's inputs"""
+    payload = json.dumps(
+        {"model": model, "prompt": prompt, "max_tokens": max_tokens, "system": system},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMCache:
+    """get/set wrapper around a single-table SQLite store.
+
+    SQLite handles concurrent writers itself, but the connection is
+    shared across the GUI's worker threads, so a lock serializes access.
+    """
+
+    def __init__(self, path=CACHE_PATH, ttl=None):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.ttl = ttl  # seconds; None = never expire
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(hash TEXT PRIMARY KEY, response TEXT, ts INTEGER)"
+        )
+        self._conn.commit()
+
+    def get(self, key):
+        """Return the cached response text, or None on miss/expiry"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, ts FROM responses WHERE hash = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        response, ts = row
+        if self.ttl is not None and time.time() - ts > self.ttl:
+            return None
+        return response
+
+    def set(self, key, response):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, response, int(time.time())),
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -5,10 +5,87 @@ A simple graphical interface for scraping job postings.
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
-import threading
+import hashlib
+import os
+import queue
 import json
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from job_scraper import JobScraper
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# job_scraper (and the lxml/bs4/requests stack it pulls in) is imported
+# lazily on the first scrape so the window appears without paying those
+# import costs up front
+
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".zoho_scraper_cache.sqlite")
+CACHE_TTL = 86400  # seconds; scraped pages go stale after a day
+
+# Query parameters that vary per visit without changing the page
+_TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'ref')
+
+# Characters not worth keeping in a default filename
+_FILENAME_BAD = re.compile(r'[^\w \-]+')
+
+
+def _url_key(url):
+    """Hash of the normalized URL: lowercase host, no tracking params."""
+    parts = urlsplit(url.strip())
+    query = urlencode([
+        (name, value) for name, value in parse_qsl(parts.query)
+        if not name.lower().startswith(_TRACKING_PARAMS)
+    ])
+    normalized = urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, '')
+    )
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+
+class JobCache:
+    """SQLite store of scraped job data keyed by URL hash.
+
+    Re-scraping the same posting during iterative CV testing costs
+    seconds (and a browser launch on the Selenium path); a cache hit
+    costs one lookup. Entries expire after the TTL.
+    """
+
+    def __init__(self, path=CACHE_PATH, ttl=CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs "
+            "(url_hash TEXT PRIMARY KEY, json TEXT, ts INTEGER)"
+        )
+        self._conn.commit()
+
+    def get(self, url):
+        """Return the cached job data dict, or None on miss/expiry"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT json, ts FROM jobs WHERE url_hash = ?", (_url_key(url),)
+            ).fetchone()
+        if row is None:
+            return None
+        payload, ts = row
+        if time.time() - ts > self.ttl:
+            return None
+        return json.loads(payload)
+
+    def set(self, url, job_data):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?)",
+                (_url_key(url), json.dumps(job_data), int(time.time())),
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
 
 
 class JobScraperGUI:
@@ -21,9 +98,89 @@ class JobScraperGUI:
         self.scraping = False
         self.scraper = None
 
+        # Scrapers kept warm between scrapes, tagged with the options
+        # they were built with; browser startup dominates Selenium
+        # latency, so reuse beats rebuilding one per click
+        self._scraper_pool = queue.Queue()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # One long-lived worker pool for scrape jobs instead of a new
+        # thread per click; results hop back to Tk via root.after
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='scrape')
+
+        # Disk cache of scraped postings so repeat URLs skip the scrape
+        self._job_cache = JobCache()
+
+        # Scraper class and shared HTTP session, both created on first
+        # scrape by _load_scraper_module. The session is shared by every
+        # scraper the GUI builds, so DNS lookups and TCP+TLS handshakes
+        # are paid once per host rather than once per scraper
+        self._JobScraper = None
+        self._http_session = None
+        self._import_lock = threading.Lock()
+
         # Create GUI elements
         self.create_widgets()
 
+    def _load_scraper_module(self):
+        """Import job_scraper on first use (runs on a worker thread).
+
+        Locked because batch scrapes hit this concurrently and the
+        shared session must only be built once.
+        """
+        with self._import_lock:
+            if self._JobScraper is None:
+                from job_scraper import JobScraper, build_session
+                self._JobScraper = JobScraper
+                self._http_session = build_session()
+
+    def _get_scraper(self, use_selenium, headless):
+        """Reuse a pooled scraper whose options match; build one otherwise."""
+        self._load_scraper_module()
+        scraper = None
+        leftover = []
+        while True:
+            try:
+                key, pooled = self._scraper_pool.get_nowait()
+            except queue.Empty:
+                break
+            if scraper is None and key == (use_selenium, headless):
+                scraper = pooled
+            else:
+                leftover.append((key, pooled))
+        for item in leftover:
+            self._scraper_pool.put(item)
+        if scraper is None:
+            scraper = self._JobScraper(
+                use_selenium=use_selenium,
+                headless=headless,
+                session=self._http_session,
+            )
+        return scraper
+
+    def _release_scraper(self, scraper, use_selenium, headless):
+        """Park a scraper for the next scrape, clearing browser state."""
+        if scraper.driver is not None:
+            try:
+                scraper.driver.delete_all_cookies()
+            except Exception:
+                pass
+        self._scraper_pool.put(((use_selenium, headless), scraper))
+
+    def _on_close(self):
+        """Close pooled scrapers before the window goes away."""
+        while True:
+            try:
+                _, scraper = self._scraper_pool.get_nowait()
+            except queue.Empty:
+                break
+            scraper.close()
+        self._executor.shutdown(wait=False)
+        if self._http_session is not None:
+            self._http_session.close()
+        self._job_cache.close()
+        self.root.destroy()
+
     def create_widgets(self):
         """Create all GUI widgets"""
 
@@ -40,11 +197,11 @@ class JobScraperGUI:
         url_frame = ttk.LabelFrame(self.root, text="Job URL", padding=10)
         url_frame.pack(fill="x", padx=10, pady=5)
 
-        tk.Label(url_frame, text="Paste the job posting URL below:").pack(anchor="w")
+        tk.Label(url_frame, text="Paste one job posting URL per line:").pack(anchor="w")
 
-        self.url_entry = tk.Entry(url_frame, font=("Arial", 10))
+        self.url_entry = tk.Text(url_frame, font=("Arial", 10), height=3)
         self.url_entry.pack(fill="x", pady=5)
-        self.url_entry.insert(0, "https://www.seek.com.au/job/88185524")  # Default example
+        self.url_entry.insert("1.0", "https://www.seek.com.au/job/88185524")  # Default example
 
         # Options Section
         options_frame = ttk.LabelFrame(self.root, text="Scraping Options", padding=10)
@@ -68,6 +225,15 @@ class JobScraperGUI:
         )
         headless_check.pack(anchor="w")
 
+        # Force refresh option
+        self.force_refresh_var = tk.BooleanVar(value=False)
+        refresh_check = ttk.Checkbutton(
+            options_frame,
+            text="Force refresh (ignore cached results)",
+            variable=self.force_refresh_var
+        )
+        refresh_check.pack(anchor="w")
+
         # Wait time
         wait_frame = tk.Frame(options_frame)
         wait_frame.pack(anchor="w", pady=5)
@@ -161,14 +327,16 @@ class JobScraperGUI:
             messagebox.showwarning("Already Scraping", "A scraping operation is already in progress.")
             return
 
-        url = self.url_entry.get().strip()
-        if not url:
+        text = self.url_entry.get("1.0", tk.END)
+        urls = [u.strip() for u in text.splitlines() if u.strip()]
+        if not urls:
             messagebox.showerror("Error", "Please enter a URL")
             return
 
-        if not url.startswith("http"):
-            messagebox.showerror("Error", "URL must start with http:// or https://")
-            return
+        for url in urls:
+            if not url.startswith("http"):
+                messagebox.showerror("Error", f"URL must start with http:// or https://\n{url}")
+                return
 
         # Disable scrape button
         self.scrape_button.config(state="disabled")
@@ -181,39 +349,65 @@ class JobScraperGUI:
         self.progress_bar.start(10)
         self.update_status("Scraping in progress...", "blue")
 
-        # Run scraping in separate thread to keep GUI responsive
-        thread = threading.Thread(target=self.scrape_job, args=(url,))
-        thread.daemon = True
-        thread.start()
+        # Run scraping on the shared worker pool to keep GUI responsive
+        self._executor.submit(self.scrape_job, urls)
+
+    def _scrape_one(self, url, use_selenium, headless, wait_time, force_refresh):
+        """Scrape a single URL, going through the cache and scraper pool."""
+        if not force_refresh:
+            cached = self._job_cache.get(url)
+            if cached is not None:
+                return cached
+
+        scraper = self._get_scraper(use_selenium, headless)
+        try:
+            job_data = scraper.scrape(url, wait_time=wait_time)
+        finally:
+            self._release_scraper(scraper, use_selenium, headless)
+
+        # Only clean scrapes are worth caching
+        if 'error' not in job_data:
+            self._job_cache.set(url, job_data)
+        return job_data
+
+    def scrape_job(self, urls):
+        """Scrape one or more URLs (runs on a worker thread).
 
-    def scrape_job(self, url):
-        """Perform the actual scraping (runs in separate thread)"""
+        Multiple URLs fan out across the shared executor so they scrape
+        concurrently; this coordinator thread occupies one worker slot
+        and waits on the rest, so fan-out runs on the remaining three.
+        """
         try:
             # Get options
             use_selenium = self.use_selenium_var.get()
             headless = self.headless_var.get()
             wait_time = self.wait_time_var.get()
+            force_refresh = self.force_refresh_var.get()
 
             # Update status
-            self.root.after(0, self.update_status, f"Initializing scraper (Selenium: {use_selenium})...", "blue")
-
-            # Create scraper
-            scraper = JobScraper(use_selenium=use_selenium, headless=headless)
-
-            # Update status
-            self.root.after(0, self.update_status, f"Fetching page: {url}", "blue")
-
-            # Scrape the job
-            job_data = scraper.scrape(url, wait_time=wait_time)
-
-            # Close scraper
-            scraper.close()
+            self.root.after(0, self.update_status, f"Scraping {len(urls)} URL(s) (Selenium: {use_selenium})...", "blue")
+
+            if len(urls) == 1:
+                result = self._scrape_one(urls[0], use_selenium, headless, wait_time, force_refresh)
+            else:
+                futures = [
+                    self._executor.submit(
+                        self._scrape_one, url, use_selenium, headless, wait_time, force_refresh
+                    )
+                    for url in urls
+                ]
+                result = []
+                for url, future in zip(urls, futures):
+                    try:
+                        result.append(future.result())
+                    except Exception as e:
+                        result.append({'error': str(e), 'url': url})
 
             # Store the data
-            self.last_job_data = job_data
+            self.last_job_data = result
 
             # Display results on main thread
-            self.root.after(0, self.display_results, job_data)
+            self.root.after(0, self.display_results, result)
 
         except Exception as e:
             error_msg = f"Error: {str(e)}"
@@ -227,79 +421,115 @@ class JobScraperGUI:
             self.scraping = False
 
     def display_results(self, job_data):
-        """Display scraped data in the results text area"""
-        self.results_text.delete(1.0, tk.END)
-
-        if 'error' in job_data:
+        """Display scraped data (one dict or a list of them) in the results area"""
+        # Build the whole report as a string and insert it in one call;
+        # each insert is a Tk round-trip with its own reflow, so dozens
+        # of them makes rendering long postings visibly jittery
+        parts = []
+
+        if isinstance(job_data, list):
+            errors = sum(1 for job in job_data if 'error' in job)
+            if errors:
+                self.update_status(f"✓ Scraped {len(job_data) - errors}/{len(job_data)} URLs ({errors} failed)", "orange")
+            else:
+                self.update_status(f"✓ Scraped {len(job_data)} URLs successfully!", "green")
+            for i, job in enumerate(job_data, 1):
+                parts.append("=" * 80 + "\n")
+                parts.append(f"RESULT {i}/{len(job_data)}: {job.get('url', 'N/A')}\n")
+                parts.append("=" * 80 + "\n\n")
+                parts.append(self._format_job(job))
+                parts.append("\n\n")
+        elif 'error' in job_data:
             self.update_status(f"Error: {job_data['error']}", "red")
-            self.results_text.insert(tk.END, f"❌ Error: {job_data['error']}\n\n")
-            self.results_text.insert(tk.END, json.dumps(job_data, indent=2))
-            return
+            parts.append(f"❌ Error: {job_data['error']}\n\n")
+            parts.append(json.dumps(job_data, indent=2))
+        else:
+            self.update_status("✓ Scraping completed successfully!", "green")
+            parts.append("=" * 80 + "\n")
+            parts.append("JOB POSTING DETAILS\n")
+            parts.append("=" * 80 + "\n\n")
+            parts.append(self._format_job(job_data))
 
-        # Display formatted data
-        self.update_status("✓ Scraping completed successfully!", "green")
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, "".join(parts))
+
+        # Scroll to top
+        self.results_text.see(1.0)
 
-        # Header
-        self.results_text.insert(tk.END, "=" * 80 + "\n")
-        self.results_text.insert(tk.END, "JOB POSTING DETAILS\n")
-        self.results_text.insert(tk.END, "=" * 80 + "\n\n")
+    def _format_job(self, job_data):
+        """Format one job's fields as a string for the results area"""
+        if 'error' in job_data:
+            return f"❌ Error: {job_data['error']}\n"
 
         # Basic info
-        self.results_text.insert(tk.END, f"📋 Job Title: {job_data.get('job_title', 'N/A')}\n")
-        self.results_text.insert(tk.END, f"🏢 Company: {job_data.get('company', 'N/A')}\n")
-        self.results_text.insert(tk.END, f"📍 Location: {job_data.get('location', 'N/A')}\n")
-        self.results_text.insert(tk.END, f"💰 Salary: {job_data.get('salary', 'N/A')}\n")
-        self.results_text.insert(tk.END, f"💼 Job Type: {job_data.get('job_type', 'N/A')}\n")
-        self.results_text.insert(tk.END, f"🏠 Remote Option: {'Yes' if job_data.get('remote_option') else 'No'}\n")
-        self.results_text.insert(tk.END, f"📅 Posted: {job_data.get('posted_date', 'N/A')}\n")
-        self.results_text.insert(tk.END, f"🔗 URL: {job_data.get('url', 'N/A')}\n")
+        parts = [
+            f"📋 Job Title: {job_data.get('job_title', 'N/A')}\n",
+            f"🏢 Company: {job_data.get('company', 'N/A')}\n",
+            f"📍 Location: {job_data.get('location', 'N/A')}\n",
+            f"💰 Salary: {job_data.get('salary', 'N/A')}\n",
+            f"💼 Job Type: {job_data.get('job_type', 'N/A')}\n",
+            f"🏠 Remote Option: {'Yes' if job_data.get('remote_option') else 'No'}\n",
+            f"📅 Posted: {job_data.get('posted_date', 'N/A')}\n",
+            f"🔗 URL: {job_data.get('url', 'N/A')}\n",
+        ]
+
+        # Bind each field once instead of re-probing the dict per use
+        desc = job_data.get('description') or ''
+        requirements = job_data.get('requirements') or []
+        skills = job_data.get('skills') or []
+        responsibilities = job_data.get('responsibilities') or []
+        benefits = job_data.get('benefits') or []
 
         # Description
-        if job_data.get('description'):
-            self.results_text.insert(tk.END, f"\n📝 Description:\n")
-            desc = job_data['description'][:500] + "..." if len(job_data['description']) > 500 else job_data['description']
-            self.results_text.insert(tk.END, f"{desc}\n")
+        if desc:
+            parts.append(f"\n📝 Description:\n")
+            if len(desc) > 500:
+                desc = desc[:500] + "..."
+            parts.append(f"{desc}\n")
 
         # Requirements
-        if job_data.get('requirements'):
-            self.results_text.insert(tk.END, f"\n✅ Requirements ({len(job_data['requirements'])}):\n")
-            for i, req in enumerate(job_data['requirements'][:10], 1):
-                self.results_text.insert(tk.END, f"  {i}. {req}\n")
-            if len(job_data['requirements']) > 10:
-                self.results_text.insert(tk.END, f"  ... and {len(job_data['requirements']) - 10} more\n")
+        if requirements:
+            parts.append(f"\n✅ Requirements ({len(requirements)}):\n")
+            parts.append("".join(
+                f"  {i}. {req}\n"
+                for i, req in enumerate(requirements[:10], 1)
+            ))
+            if len(requirements) > 10:
+                parts.append(f"  ... and {len(requirements) - 10} more\n")
 
         # Skills
-        if job_data.get('skills'):
-            self.results_text.insert(tk.END, f"\n🔧 Skills ({len(job_data['skills'])}):\n")
-            skills_str = ", ".join(job_data['skills'][:15])
-            self.results_text.insert(tk.END, f"  {skills_str}\n")
-            if len(job_data['skills']) > 15:
-                self.results_text.insert(tk.END, f"  ... and {len(job_data['skills']) - 15} more\n")
+        if skills:
+            parts.append(f"\n🔧 Skills ({len(skills)}):\n")
+            parts.append(f"  {', '.join(skills[:15])}\n")
+            if len(skills) > 15:
+                parts.append(f"  ... and {len(skills) - 15} more\n")
 
         # Responsibilities
-        if job_data.get('responsibilities'):
-            self.results_text.insert(tk.END, f"\n📌 Responsibilities ({len(job_data['responsibilities'])}):\n")
-            for i, resp in enumerate(job_data['responsibilities'][:10], 1):
-                self.results_text.insert(tk.END, f"  {i}. {resp}\n")
-            if len(job_data['responsibilities']) > 10:
-                self.results_text.insert(tk.END, f"  ... and {len(job_data['responsibilities']) - 10} more\n")
+        if responsibilities:
+            parts.append(f"\n📌 Responsibilities ({len(responsibilities)}):\n")
+            parts.append("".join(
+                f"  {i}. {resp}\n"
+                for i, resp in enumerate(responsibilities[:10], 1)
+            ))
+            if len(responsibilities) > 10:
+                parts.append(f"  ... and {len(responsibilities) - 10} more\n")
 
         # Benefits
-        if job_data.get('benefits'):
-            self.results_text.insert(tk.END, f"\n🎁 Benefits ({len(job_data['benefits'])}):\n")
-            for i, benefit in enumerate(job_data['benefits'][:10], 1):
-                self.results_text.insert(tk.END, f"  {i}. {benefit}\n")
-            if len(job_data['benefits']) > 10:
-                self.results_text.insert(tk.END, f"  ... and {len(job_data['benefits']) - 10} more\n")
+        if benefits:
+            parts.append(f"\n🎁 Benefits ({len(benefits)}):\n")
+            parts.append("".join(
+                f"  {i}. {benefit}\n"
+                for i, benefit in enumerate(benefits[:10], 1)
+            ))
+            if len(benefits) > 10:
+                parts.append(f"  ... and {len(benefits) - 10} more\n")
 
         # Full JSON at the end
-        self.results_text.insert(tk.END, f"\n{'-' * 80}\n")
-        self.results_text.insert(tk.END, "FULL JSON DATA:\n")
-        self.results_text.insert(tk.END, f"{'-' * 80}\n")
-        self.results_text.insert(tk.END, json.dumps(job_data, indent=2, ensure_ascii=False))
-
-        # Scroll to top
-        self.results_text.see(1.0)
+        parts.append(f"\n{'-' * 80}\n")
+        parts.append("FULL JSON DATA:\n")
+        parts.append(f"{'-' * 80}\n")
+        parts.append(json.dumps(job_data, indent=2, ensure_ascii=False))
+        return "".join(parts)
 
     def clear_results(self):
         """Clear the results text area"""
@@ -315,10 +545,12 @@ class JobScraperGUI:
 
         # Generate default filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        job_title = self.last_job_data.get('job_title', 'job')
+        if isinstance(self.last_job_data, list):
+            job_title = f"{len(self.last_job_data)} jobs"
+        else:
+            job_title = self.last_job_data.get('job_title', 'job')
         # Clean job title for filename
-        job_title_clean = "".join(c for c in job_title if c.isalnum() or c in (' ', '-', '_')).strip()
-        job_title_clean = job_title_clean[:50]  # Limit length
+        job_title_clean = _FILENAME_BAD.sub('', job_title)[:50].strip()
         default_filename = f"{job_title_clean}_{timestamp}.json"
 
         # Ask user where to save
@@ -329,13 +561,23 @@ class JobScraperGUI:
         )
 
         if filepath:
-            try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(self.last_job_data, f, indent=2, ensure_ascii=False)
-                messagebox.showinfo("Success", f"Data saved to:\n{filepath}")
-                self.update_status(f"Saved to: {filepath}", "green")
-            except Exception as e:
-                messagebox.showerror("Save Error", f"Failed to save file:\n{str(e)}")
+            # Serialize once to bytes up front, then write on a worker
+            # thread so a big posting or slow disk can't stall the GUI
+            payload = json.dumps(self.last_job_data, indent=2, ensure_ascii=False).encode('utf-8')
+            self.update_status(f"Saving to: {filepath}", "blue")
+            self._executor.submit(self._write_file, filepath, payload)
+
+    def _write_file(self, filepath, payload):
+        """Write serialized job data to disk (runs on a worker thread)"""
+        try:
+            with open(filepath, 'wb') as f:
+                f.write(payload)
+        except Exception as e:
+            self.root.after(0, self.update_status, "Save failed", "red")
+            self.root.after(0, messagebox.showerror, "Save Error", f"Failed to save file:\n{str(e)}")
+        else:
+            self.root.after(0, self.update_status, f"Saved to: {filepath}", "green")
+            self.root.after(0, messagebox.showinfo, "Success", f"Data saved to:\n{filepath}")
 
 
 def main():
@@ -6,6 +6,24 @@ This will help diagnose the issue
 import json
 import os
 from anthropic import Anthropic
+from llm_cache import LLMCache, make_key
+
+
+def cached_complete(client, cache, prompt, model, max_tokens):
+    """Return (reply_text, from_cache); repeat prompts skip the API call"""
+    key = make_key(model, prompt, max_tokens)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached, True
+    response = client.messages.create(
+        model=model,
+        max_tokens=max_tokens,
+        messages=[{"role": "user", "content": prompt}]
+    )
+    text = response.content[0].text
+    cache.set(key, text)
+    return text, False
+
 
 def test_cv_generation():
     """Test CV generation directly"""
@@ -34,6 +52,7 @@ Strong skills in project management and team collaboration.
     print("\n1. Testing API connection...")
     try:
         client = Anthropic(api_key=API_KEY)
+        cache = LLMCache()  # repeat runs with the same prompt skip the API
         print("   ✓ API client initialized")
     except Exception as e:
         print(f"   ✗ FAILED: {e}")
@@ -89,14 +108,13 @@ Job:
 
 Write a brief 2-paragraph customized CV summary."""
 
-        response = client.messages.create(
+        cv_content, from_cache = cached_complete(
+            client, cache, prompt,
             model="claude-3-haiku-20240307",
             max_tokens=1000,
-            messages=[{"role": "user", "content": prompt}]
         )
-        
-        cv_content = response.content[0].text
-        print(f"   ✓ CV generated ({len(cv_content)} characters)")
+        source = "from cache" if from_cache else "via API"
+        print(f"   ✓ CV generated ({len(cv_content)} characters, {source})")
         
     except Exception as e:
         print(f"   ✗ FAILED: {e}")
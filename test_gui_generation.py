@@ -5,7 +5,13 @@ Test the GUI generation logic directly without the GUI
 import json
 import os
 from anthropic import Anthropic
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from llm_cache import LLMCache, make_key
+
+# How many CV generations run at once; each is a multi-second API round
+# trip, so overlapping them cuts batch wall time roughly by this factor
+MAX_CONCURRENT_JOBS = 5
 
 # Configuration
 API_KEY = "sk-ant-REDACTED"
@@ -43,6 +49,21 @@ SKILLS
 - Communication
 """
 
+def cached_complete(client, cache, prompt, model, max_tokens):
+    """Return (reply_text, from_cache); repeat prompts skip the API call"""
+    key = make_key(model, prompt, max_tokens)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached, True
+    response = client.messages.create(
+        model=model,
+        max_tokens=max_tokens,
+        messages=[{"role": "user", "content": prompt}]
+    )
+    text = response.content[0].text
+    cache.set(key, text)
+    return text, False
+
 def read_document(filepath):
     """Read a document (simplified)"""
     try:
@@ -60,6 +81,7 @@ def test_generation():
     print("\n1. Initializing Claude API...")
     try:
         client = Anthropic(api_key=API_KEY)
+        cache = LLMCache()  # repeat runs with the same prompt skip the API
         print("   ✓ API initialized")
     except Exception as e:
         print(f"   ✗ FAILED: {e}")
@@ -104,29 +126,25 @@ def test_generation():
         print(f"   ✗ FAILED: {e}")
         return
     
-    # Step 5: Generate for first job
-    print("\n5. Generating CV for first job...")
-    job_file = job_files[0]
-    job_filename = os.path.basename(job_file)
-    print(f"   Processing: {job_filename}")
-    
-    try:
+    # Step 5: Generate CVs for every job, a few at a time
+    print(f"\n5. Generating CVs for {len(job_files)} job(s) ({MAX_CONCURRENT_JOBS} at a time)...")
+
+    def gen_one(job_file):
+        """Generate and save one CV; returns (job_filename, cv_content)"""
+        job_filename = os.path.basename(job_file)
+
         # Load job data
         with open(job_file, 'r', encoding='utf-8') as f:
             job_data = json.load(f)
-        
+
         job_title = job_data.get('job_title', 'Unknown')
         company = job_data.get('company', 'Unknown')
-        print(f"   Job: {job_title} at {company}")
-        
+
         # Check if error in job data
         if 'error' in job_data:
-            print(f"   ⚠ Job data has error: {job_data['error']}")
-            return
-        
-        # Generate CV
-        print("   Calling Claude API to generate CV...")
-        
+            print(f"   ⚠ Skipped {job_filename}: {job_data['error']}")
+            return job_filename, None
+
         cv_prompt = f"""You are an expert CV writer. I need you to create a customized CV/resume tailored for a specific job.
 
 Here is my complete professional profile:
@@ -143,47 +161,51 @@ Here is the job I'm applying for:
 Please create a customized CV that highlights my most relevant experience for THIS specific job.
 Format as plain text with clear sections. Keep it concise (2-3 paragraphs for this test)."""
 
-        response = client.messages.create(
+        cv_content, from_cache = cached_complete(
+            client, cache, cv_prompt,
             model="claude-3-haiku-20240307",
             max_tokens=2000,
-            messages=[{"role": "user", "content": cv_prompt}]
         )
-        
-        cv_content = response.content[0].text
-        print(f"   ✓ CV generated ({len(cv_content)} characters)")
-        
+        source = "from cache" if from_cache else "via API"
+
         # Save to file
         base_name = os.path.splitext(job_filename)[0]
-        output_filename = f"{base_name}_CV.txt"
-        output_path = os.path.join(output_folder, output_filename)
-        
-        print(f"   Saving to: {output_path}")
+        output_path = os.path.join(output_folder, f"{base_name}_CV.txt")
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(cv_content)
-        
-        print(f"   ✓ File saved!")
-        
-        # Verify file exists
-        if os.path.exists(output_path):
-            file_size = os.path.getsize(output_path)
-            print(f"   ✓ Verified: File exists ({file_size} bytes)")
-        else:
-            print(f"   ✗ ERROR: File was not saved!")
-        
-    except Exception as e:
-        print(f"   ✗ FAILED: {e}")
-        import traceback
-        print(traceback.format_exc())
+
+        print(f"   ✓ {job_filename}: {job_title} at {company} "
+              f"({len(cv_content)} characters, {source})")
+        return job_filename, cv_content
+
+    generated = []
+    failed = 0
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_JOBS) as executor:
+        futures = [executor.submit(gen_one, jf) for jf in job_files]
+        for job_file, future in zip(job_files, futures):
+            try:
+                job_filename, cv_content = future.result()
+            except Exception as e:
+                print(f"   ✗ FAILED {os.path.basename(job_file)}: {e}")
+                failed += 1
+                continue
+            if cv_content is not None:
+                generated.append((job_filename, cv_content))
+
+    if not generated:
+        print("\n   ✗ No CVs were generated")
         return
-    
+
     # Success
     print("\n" + "="*80)
     print("✓ TEST COMPLETE!")
     print("="*80)
     print(f"\nOutput folder: {output_folder}")
-    print("\nCV Preview:")
+    print(f"Generated {len(generated)}/{len(job_files)} CV(s)" +
+          (f", {failed} failed" if failed else ""))
+    print("\nCV Preview (first job):")
     print("-"*80)
-    print(cv_content[:300] + "...")
+    print(generated[0][1][:300] + "...")
     print("-"*80)
     
     # List files in output folder